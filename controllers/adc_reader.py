@@ -7,16 +7,30 @@ Designed for pressure transducer input in the leak test system.
 """
 
 import platform
+from functools import lru_cache
 import time
 import logging
 from typing import Optional, Tuple
 
+import numpy as np
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ADS1115 full-scale input voltage for each gain setting
+GAIN_FULL_SCALE_V = {2/3: 6.144, 1: 4.096, 2: 2.048, 4: 1.024, 8: 0.512, 16: 0.256}
+
+# 4-20mA loop receiver module raw ADC readings from datasheet
+ADC_RAW_4MA = 6430
+ADC_RAW_20MA = 32154
+
+# ADS1115 register holding the latest conversion result
+ADS1115_CONVERSION_REGISTER = 0x00
+
+@lru_cache(maxsize=1)
 def is_raspberry_pi():
-    """Detect if running on a Raspberry Pi."""
+    """Detect if running on a Raspberry Pi (probed once per process)."""
     machine = platform.machine().lower()
     release = platform.release().lower()
     platform_str = platform.platform().lower()
@@ -54,10 +68,19 @@ class ADCReader:
         self.sample_rate = sample_rate
         self.is_pi = is_raspberry_pi()
         
+        # Raw ADC to current conversion as a single multiply-add
+        self._raw_to_ma_slope = 16.0 / (ADC_RAW_20MA - ADC_RAW_4MA)
+        self._raw_to_ma_intercept = 4.0 - ADC_RAW_4MA * self._raw_to_ma_slope
+        
         # High-speed sampling settings
         self.high_speed_mode = False
         self.continuous_mode = False
         
+        # Persistent SMBus handle and prebuilt messages for direct
+        # conversion-register reads in continuous mode
+        self._conversion_bus = None
+        self._conversion_msgs = None
+        
         # Initialize ADC
         self._initialize_adc()
         
@@ -148,6 +171,85 @@ class ADCReader:
             logger.error(f"Failed to read raw ADC value: {e}")
             return 0
     
+    def read_raw_burst(self, num_samples: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Read several raw ADC values back-to-back into an array.
+        
+        Voltage and current can be derived from the returned values with
+        raw_to_voltage() and raw_adc_to_current_ma() without triggering
+        further conversions. Once start_conversion() has opened the
+        conversion register, readings are fetched from it once per
+        conversion period instead of through the ADS1115 driver.
+        
+        Args:
+            num_samples: Number of raw readings to take
+            out: Optional preallocated int32 array of at least num_samples
+            
+        Returns:
+            np.ndarray: Raw ADC readings. A failed read ends the burst, so
+            the array is shorter than num_samples and holds only the
+            readings taken before the failure.
+        """
+        if out is None:
+            out = np.empty(num_samples, dtype=np.int32)
+        
+        if self._conversion_bus is not None:
+            return self._read_conversion_burst(num_samples, out)
+        
+        channel = self.channel
+        i = 0
+        try:
+            for i in range(num_samples):
+                out[i] = channel.value
+        except Exception as e:
+            logger.error(f"Failed to read raw ADC burst after {i} of {num_samples} samples: {e}")
+            return out[:i]
+        
+        return out[:num_samples]
+    
+    def _read_conversion_burst(self, num_samples: int, out: np.ndarray) -> np.ndarray:
+        """
+        Read a burst from the conversion register, one reading per conversion.
+        
+        Reads are paced against absolute deadlines so the burst tracks the
+        ADC's conversion period rather than re-reading the same result.
+        
+        Args:
+            num_samples: Number of raw readings to take
+            out: Preallocated int32 array of at least num_samples
+            
+        Returns:
+            np.ndarray: Raw ADC readings, truncated at the first failed read
+        """
+        period = 1.0 / self.sample_rate
+        read_last = self.read_last
+        deadline = time.monotonic()
+        i = 0
+        try:
+            for i in range(num_samples):
+                out[i] = read_last()
+                deadline += period
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+        except Exception as e:
+            logger.error(f"Failed to read raw ADC burst after {i} of {num_samples} samples: {e}")
+            return out[:i]
+        
+        return out[:num_samples]
+    
+    def raw_to_voltage(self, raw_value):
+        """
+        Convert raw ADC value(s) to voltage using the configured gain.
+        
+        Args:
+            raw_value: Raw ADC reading or numpy array of readings
+            
+        Returns:
+            Voltage in volts (float, or array for array input)
+        """
+        return raw_value * (GAIN_FULL_SCALE_V.get(self.gain, 2.048) / 32767)
+    
     def read_voltage(self) -> float:
         """
         Read voltage from ADC.
@@ -188,27 +290,15 @@ class ADCReader:
         - 20mA = ~32154 raw ADC value
         
         Args:
-            raw_value: Raw ADC reading (0-32767 for ADS1115)
+            raw_value: Raw ADC reading (0-32767 for ADS1115), or numpy array of readings
             
         Returns:
-            float: Current in milliamps
+            float: Current in milliamps (array for array input)
         """
-        # Module specifications from datasheet
-        ADC_4MA = 6430
-        ADC_20MA = 32154
-        
-        # Linear interpolation: current = 4 + (raw - 6430) * (20-4) / (32154-6430)
-        if raw_value <= ADC_4MA:
-            # Below 4mA range - extrapolate
-            current_ma = 4.0 + (raw_value - ADC_4MA) * 16.0 / (ADC_20MA - ADC_4MA)
-        elif raw_value >= ADC_20MA:
-            # Above 20mA range - extrapolate  
-            current_ma = 4.0 + (raw_value - ADC_4MA) * 16.0 / (ADC_20MA - ADC_4MA)
-        else:
-            # Normal range - interpolate
-            current_ma = 4.0 + (raw_value - ADC_4MA) * 16.0 / (ADC_20MA - ADC_4MA)
-        
-        return current_ma
+        # Linear interpolation: current = 4 + (raw - 6430) * (20-4) / (32154-6430),
+        # precomputed as slope and intercept. Values outside the 4-20mA range
+        # are extrapolated on the same line
+        return raw_value * self._raw_to_ma_slope + self._raw_to_ma_intercept
     
     def read_current_ma(self, shunt_resistor: float = 250.0) -> float:
         """
@@ -284,8 +374,8 @@ class ADCReader:
             "is_pi": self.is_pi,
             "mock_mode": not self.is_pi,
             "module_type": "4-20mA Current Loop Receiver",
-            "adc_range_4ma": 6430,
-            "adc_range_20ma": 32154
+            "adc_range_4ma": ADC_RAW_4MA,
+            "adc_range_20ma": ADC_RAW_20MA
         }
     
     def _configure_sample_rate(self):
@@ -344,6 +434,66 @@ class ADCReader:
         else:
             logger.info("✓ Single-shot sampling mode enabled")
     
+    def start_conversion(self):
+        """
+        Start continuous conversions so reads return the latest sample.
+        
+        In continuous mode the ADS1115 converts in the background at the
+        configured sample rate, and read_last() only fetches the conversion
+        register instead of starting a conversion and waiting for it.
+        """
+        if self.is_pi:
+            try:
+                from adafruit_ads1x15.ads1x15 import Mode
+                self.ads.mode = Mode.CONTINUOUS
+                # First read selects the channel and starts conversions
+                self.channel.value
+                self._open_conversion_bus()
+            except Exception as e:
+                logger.warning(f"Could not start continuous conversion: {e}")
+        
+        self.continuous_mode = True
+    
+    def _open_conversion_bus(self):
+        """
+        Open a persistent SMBus handle for reading the conversion register.
+        
+        Once conversions run continuously, a reading is a single
+        pointer-write plus 2-byte read transaction, which bypasses the
+        per-call configuration and locking of the Adafruit driver.
+        """
+        if self._conversion_bus is not None:
+            return
+        
+        try:
+            from smbus2 import SMBus, i2c_msg
+            self._conversion_bus = SMBus(self.bus_number)
+            self._conversion_msgs = (
+                i2c_msg.write(self.i2c_address, [ADS1115_CONVERSION_REGISTER]),
+                i2c_msg.read(self.i2c_address, 2)
+            )
+        except Exception as e:
+            logger.warning(f"Direct I2C reads unavailable, using ADS1115 driver: {e}")
+            self._conversion_bus = None
+    
+    def read_last(self) -> int:
+        """
+        Read the most recent conversion result started by start_conversion().
+        
+        Returns:
+            int: Raw ADC reading (0-32767 for ADS1115)
+            
+        Raises:
+            Exception: If the I2C read fails, so a failed read is never
+            mistaken for a zero reading
+        """
+        if self._conversion_bus is None:
+            return self.channel.value
+        
+        write, read = self._conversion_msgs
+        self._conversion_bus.i2c_rdwr(write, read)
+        return int.from_bytes(bytes(read), 'big', signed=True)
+    
     def read_current_fast(self) -> float:
         """
         Read current with minimal latency for high-speed applications.
@@ -407,10 +557,10 @@ if __name__ == "__main__":
         
         print("\n--- Single Reading Test ---")
         
-        # Test single readings
+        # Test single readings - one conversion, voltage and current derived from it
         raw_value = adc.read_raw_value()
-        voltage = adc.read_voltage()
-        current = adc.read_current_ma()
+        voltage = adc.raw_to_voltage(raw_value)
+        current = adc.raw_adc_to_current_ma(raw_value)
         
         # Also show old voltage-based calculation for comparison
         current_old_method = adc.voltage_to_current_ma(voltage)
@@ -421,10 +571,6 @@ if __name__ == "__main__":
         print(f"Current (old shunt method): {current_old_method:.2f} mA")
         print(f"In valid range (4-20mA): {adc.is_current_in_range(current)}")
         
-        # Show expected values based on datasheet
-        expected_current = adc.raw_adc_to_current_ma(raw_value)
-        print(f"Expected current from raw ADC: {expected_current:.2f} mA")
-        
         print("\n--- Multiple Samples Test ---")
         
         # Test multiple samples
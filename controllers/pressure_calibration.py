@@ -9,9 +9,12 @@ Provides calibration capabilities for pressure transducers.
 import logging
 import time
 import json
+from bisect import bisect_right
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 # Handle imports for both module use and standalone testing
 try:
     from .adc_reader import ADCReader
@@ -63,6 +66,7 @@ class PressureCalibration:
         """
         # Load configuration if not provided
         config_manager = get_config_manager()
+        self._config_manager = config_manager
         
         if min_pressure_psi is None or max_pressure_psi is None or min_current_ma is None or max_current_ma is None:
             config_data = config_manager.get_pressure_calibration_config()
@@ -97,6 +101,22 @@ class PressureCalibration:
         # Calibration points (current_mA, pressure_PSI)
         self.calibration_points: List[CalibrationPoint] = []
         
+        # Sorted interpolation table built from the calibration points
+        self._table_currents = np.empty(0)
+        self._table_pressures = np.empty(0)
+        
+        # Scalar lookup form of the table: breakpoint currents plus an
+        # (start current, start pressure, slope) triple per segment
+        self._segment_currents: List[float] = []
+        self._segments: List[Tuple[float, float, float]] = []
+        
+        # Last raw ADC reading and its pressure, reused while the sensor is stable
+        self._last_raw = None
+        self._last_pressure = 0.0
+        
+        # Formatted calibration summary, built on first request
+        self._calibration_info = None
+        
         # Set user's specific calibration from config
         self._set_config_calibration(config_manager)
         
@@ -111,6 +131,7 @@ class PressureCalibration:
             CalibrationPoint(12.029, 0.5),   # Midpoint: 0.5 PSI (average of 12.031 and 12.026)
             CalibrationPoint(20.037, 1.0)    # Full scale: 1.0 PSI
         ]
+        self._build_interpolation_table()
         logger.info("Using user's specific PT calibration data")
         logger.info("Calibration: 4.025mA=0PSI, 12.029mA=0.5PSI, 20.037mA=1PSI")
     
@@ -125,11 +146,30 @@ class PressureCalibration:
             CalibrationPoint(cal_config.midpoint_current_ma, cal_config.midpoint_pressure_psi),  # Midpoint
             CalibrationPoint(cal_config.full_scale_current_ma, self.max_pressure_psi)  # Full scale
         ]
+        self._build_interpolation_table()
         logger.info("Using PT calibration data from configuration")
         logger.info(f"Calibration: {cal_config.balance_current_ma:.3f}mA=0PSI, "
                    f"{cal_config.midpoint_current_ma:.3f}mA={cal_config.midpoint_pressure_psi}PSI, "
                    f"{cal_config.full_scale_current_ma:.3f}mA={self.max_pressure_psi}PSI")
     
+    def _build_interpolation_table(self):
+        """Rebuild the sorted current/pressure arrays used for multi-point interpolation."""
+        points = sorted(self.calibration_points, key=lambda p: p.current_ma)
+        self._table_currents = np.array([p.current_ma for p in points], dtype=float)
+        self._table_pressures = np.array([p.pressure_psi for p in points], dtype=float)
+        
+        # Precompute each segment's slope so a scalar conversion is one
+        # lookup and one multiply-add
+        self._segment_currents = [p.current_ma for p in points]
+        self._segments = []
+        for start, end in zip(points, points[1:]):
+            span = end.current_ma - start.current_ma
+            slope = (end.pressure_psi - start.pressure_psi) / span if span else 0.0
+            self._segments.append((start.current_ma, start.pressure_psi, slope))
+        
+        self._last_raw = None
+        self._calibration_info = None
+    
     def current_to_pressure_linear(self, current_ma: float) -> float:
         """
         Convert current to pressure using linear interpolation.
@@ -166,36 +206,19 @@ class PressureCalibration:
         Returns:
             float: Pressure in PSI
         """
-        if len(self.calibration_points) < 2:
+        currents = self._segment_currents
+        if len(currents) < 2:
             return self.current_to_pressure_linear(current_ma)
         
-        # Sort calibration points by current
-        points = sorted(self.calibration_points, key=lambda p: p.current_ma)
+        # Piecewise-linear lookup in the presorted table; readings outside
+        # the calibrated range are clamped to the end points
+        if current_ma <= currents[0]:
+            return float(self._table_pressures[0])
+        if current_ma >= currents[-1]:
+            return float(self._table_pressures[-1])
         
-        # Find the two points to interpolate between
-        if current_ma <= points[0].current_ma:
-            # Extrapolate below range
-            return points[0].pressure_psi
-        elif current_ma >= points[-1].current_ma:
-            # Extrapolate above range  
-            return points[-1].pressure_psi
-        else:
-            # Interpolate between points
-            for i in range(len(points) - 1):
-                if points[i].current_ma <= current_ma <= points[i + 1].current_ma:
-                    # Linear interpolation between these two points
-                    x1, y1 = points[i].current_ma, points[i].pressure_psi
-                    x2, y2 = points[i + 1].current_ma, points[i + 1].pressure_psi
-                    
-                    if x2 == x1:
-                        return y1
-                    
-                    # Linear interpolation formula
-                    pressure_psi = y1 + (y2 - y1) * (current_ma - x1) / (x2 - x1)
-                    return pressure_psi
-        
-        # Fallback to linear
-        return self.current_to_pressure_linear(current_ma)
+        start_current, start_pressure, slope = self._segments[bisect_right(currents, current_ma) - 1]
+        return start_pressure + slope * (current_ma - start_current)
     
     def current_to_pressure(self, current_ma: float) -> float:
         """
@@ -209,6 +232,44 @@ class PressureCalibration:
         """
         return self.current_to_pressure_multipoint(current_ma)
     
+    def pressure_from_raw(self, raw_adc: int) -> float:
+        """
+        Convert a raw ADC reading to pressure.
+        
+        The result for the last raw value is remembered, so consecutive
+        identical readings skip the conversion entirely.
+        
+        Args:
+            raw_adc: Raw ADC reading
+            
+        Returns:
+            float: Pressure in PSI
+        """
+        if raw_adc == self._last_raw:
+            return self._last_pressure
+        
+        pressure_psi = self.current_to_pressure(self.adc_reader.raw_adc_to_current_ma(raw_adc))
+        self._last_raw = raw_adc
+        self._last_pressure = pressure_psi
+        return pressure_psi
+    
+    def current_to_pressure_batch(self, currents_ma) -> np.ndarray:
+        """
+        Convert an array of current readings to pressure in one call.
+        
+        Args:
+            currents_ma: Sequence or numpy array of currents in milliamps
+            
+        Returns:
+            np.ndarray: Pressure in PSI for each reading
+        """
+        currents_ma = np.asarray(currents_ma, dtype=float)
+        
+        if len(self._table_currents) < 2:
+            return self.current_to_pressure_linear(currents_ma)
+        
+        return np.interp(currents_ma, self._table_currents, self._table_pressures)
+    
     def read_pressure_psi(self, num_samples: int = None) -> float:
         """
         Read current pressure in PSI using optimized high-speed sampling.
@@ -220,8 +281,7 @@ class PressureCalibration:
             float: Current pressure in PSI
         """
         # Get configuration for sampling behavior
-        config_manager = get_config_manager()
-        system_config = config_manager.get_system_config('system')
+        system_config = self._config_manager.get_system_config('system')
         
         # Use config default if not specified
         if num_samples is None:
@@ -230,7 +290,7 @@ class PressureCalibration:
         # Read current from ADC using optimized methods
         if num_samples == 1:
             # Single fast read for maximum speed
-            current_ma = self.adc_reader.read_current_fast()
+            return self.pressure_from_raw(self.adc_reader.read_raw_value())
         elif (system_config.get('enable_burst_sampling', False) and 
               num_samples <= system_config.get('burst_sample_count', 10)):
             # Use burst sampling for small sample counts
@@ -255,6 +315,20 @@ class PressureCalibration:
         
         return pressure_psi
     
+    def read_pressures_psi(self, num_samples: int) -> np.ndarray:
+        """
+        Read a burst of individual pressure samples without averaging.
+        
+        Args:
+            num_samples: Number of samples to read
+            
+        Returns:
+            np.ndarray: Pressure in PSI for each sample; shorter than
+            num_samples if an ADC read failed part way through the burst
+        """
+        raw_values = self.adc_reader.read_raw_burst(num_samples)
+        return self.current_to_pressure_batch(self.adc_reader.raw_adc_to_current_ma(raw_values))
+    
     def add_calibration_point(self, current_ma: float, pressure_psi: float):
         """
         Add a calibration point.
@@ -265,6 +339,7 @@ class PressureCalibration:
         """
         point = CalibrationPoint(current_ma, pressure_psi)
         self.calibration_points.append(point)
+        self._build_interpolation_table()
         logger.info(f"Added calibration point: {point}")
     
     def calibrate_from_known_pressure(self, known_pressure_psi: float, num_samples: int = 10) -> bool:
@@ -354,16 +429,23 @@ class PressureCalibration:
         """
         Get calibration information and current status.
         
+        The calibration fields are formatted once and reused until the
+        calibration points change; ADC info is always read fresh.
+        
         Returns:
             dict: Calibration status and configuration
         """
-        return {
-            "pressure_range": f"{self.min_pressure_psi}-{self.max_pressure_psi} PSI",
-            "current_range": f"{self.min_current_ma}-{self.max_current_ma} mA",
-            "num_calibration_points": len(self.calibration_points),
-            "calibration_points": [str(p) for p in self.calibration_points],
-            "adc_info": self.adc_reader.get_adc_info()
-        }
+        if self._calibration_info is None:
+            self._calibration_info = {
+                "pressure_range": f"{self.min_pressure_psi}-{self.max_pressure_psi} PSI",
+                "current_range": f"{self.min_current_ma}-{self.max_current_ma} mA",
+                "num_calibration_points": len(self.calibration_points),
+                "calibration_points": [str(p) for p in self.calibration_points]
+            }
+        
+        info = dict(self._calibration_info)
+        info["adc_info"] = self.adc_reader.get_adc_info()
+        return info
     
     def save_calibration(self, filename: str = "pressure_calibration.json"):
         """Save calibration to file."""
@@ -398,6 +480,7 @@ class PressureCalibration:
                 CalibrationPoint(p["current_ma"], p["pressure_psi"])
                 for p in data["calibration_points"]
             ]
+            self._build_interpolation_table()
             
             logger.info(f"Calibration loaded from {filename}")
             return True
@@ -7,12 +7,13 @@ Provides hardware abstraction for relay control with mock support for developmen
 """
 
 import platform
+from functools import lru_cache
+import threading
 import time
 import logging
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Handle imports for both module use and standalone testing
@@ -25,8 +26,9 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from config.config_manager import get_config_manager
 
+@lru_cache(maxsize=1)
 def is_raspberry_pi():
-    """Detect if running on a Raspberry Pi."""
+    """Detect if running on a Raspberry Pi (probed once per process)."""
     machine = platform.machine().lower()
     release = platform.release().lower()
     platform_str = platform.platform().lower()
@@ -64,6 +66,7 @@ class RelayController:
         self.is_pi = is_raspberry_pi()
         self.relays = {}  # Will store relay objects
         self.relay_states = {}  # Track current states
+        self._pulse_timers = {}  # Pending background pulse turn-off timers
         
         # Initialize relay hardware
         self._initialize_relays()
@@ -156,6 +159,134 @@ class RelayController:
             logger.error(f"Failed to set relay '{relay_id}' to {state}: {e}")
             return False
     
+    def set_states(self, states: Dict[str, bool]) -> bool:
+        """
+        Set the state of several relays in a single call.
+        
+        All relay ids are validated before any output is driven, and the
+        combined result is logged once instead of once per relay.
+        
+        Args:
+            states: Dictionary mapping relay_id to desired state
+        
+        Returns:
+            bool: True if every relay was set successfully, False if error
+        """
+        missing = [relay_id for relay_id in states if relay_id not in self.relays]
+        if missing:
+            logger.error(f"Relays {missing} not found. Available relays: {list(self.relays.keys())}")
+            return False
+        
+        success = True
+        for relay_id, state in states.items():
+            try:
+                if state:
+                    self.relays[relay_id].on()
+                else:
+                    self.relays[relay_id].off()
+                self.relay_states[relay_id] = state
+            except Exception as e:
+                logger.error(f"Failed to set relay '{relay_id}' to {state}: {e}")
+                success = False
+        
+        # Only build the summary when it will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            summary = ", ".join(
+                f"'{relay_id}' (GPIO {self.relay_config[relay_id]}) {'ON' if state else 'OFF'}"
+                for relay_id, state in states.items()
+            )
+            logger.info(f"Relays set: {summary}")
+        
+        return success
+    
+    def get_setter(self, relay_id: str) -> Callable[[bool], bool]:
+        """
+        Get a callable that sets the state of one relay.
+        
+        The relay object, GPIO pin and log messages are resolved once here,
+        so callers that switch the same relay repeatedly skip the lookups
+        done by set_state(). Unlike set_state(), hardware errors raised by
+        the relay are propagated to the caller.
+        
+        Args:
+            relay_id: Identifier for the relay (e.g., "fill", "exhaust")
+        
+        Returns:
+            Callable taking the desired state and returning True on success
+        
+        Raises:
+            ValueError: If the relay is not found
+        """
+        if relay_id not in self.relays:
+            raise ValueError(f"Relay '{relay_id}' not found. Available relays: {list(self.relays.keys())}")
+        
+        relay = self.relays[relay_id]
+        relay_on = relay.on
+        relay_off = relay.off
+        relay_states = self.relay_states
+        gpio_pin = self.relay_config[relay_id]
+        on_message = f"Relay '{relay_id}' (GPIO {gpio_pin}) turned ON"
+        off_message = f"Relay '{relay_id}' (GPIO {gpio_pin}) turned OFF"
+        
+        def set_relay_state(state: bool) -> bool:
+            if state:
+                relay_on()
+                relay_states[relay_id] = True
+                logger.info(on_message)
+            else:
+                relay_off()
+                relay_states[relay_id] = False
+                logger.info(off_message)
+            return True
+        
+        return set_relay_state
+    
+    def pulse(self, relay_id: str, duration: float, wait: bool = True) -> bool:
+        """
+        Turn a relay on for a fixed time, then turn it off again.
+        
+        GPIO relays have no native timed-pulse command, so the pulse is timed
+        on the host. When waiting, the relay is turned off even if the wait is
+        interrupted. With wait=False the relay is turned off by a background
+        timer and the call returns immediately; a new pulse on the same relay
+        replaces any pending one.
+        
+        Args:
+            relay_id: Identifier for the relay (e.g., "fill", "exhaust")
+            duration: Time in seconds to keep the relay on
+            wait: True to block until the relay has been turned off
+            
+        Returns:
+            bool: True if successful
+            
+        Raises:
+            ValueError: If the relay is not found
+        """
+        set_relay = self.get_setter(relay_id)
+        self._cancel_pulse(relay_id)
+        
+        set_relay(True)
+        
+        if not wait:
+            timer = threading.Timer(duration, self.set_state, (relay_id, False))
+            timer.daemon = True
+            self._pulse_timers[relay_id] = timer
+            timer.start()
+            return True
+        
+        try:
+            time.sleep(duration)
+        finally:
+            set_relay(False)
+        
+        return True
+    
+    def _cancel_pulse(self, relay_id: str):
+        """Cancel a pending background pulse turn-off for a relay."""
+        timer = self._pulse_timers.pop(relay_id, None)
+        if timer is not None:
+            timer.cancel()
+    
     def get_state(self, relay_id: str) -> Optional[bool]:
         """
         Get the current state of a relay.
@@ -168,6 +299,42 @@ class RelayController:
         """
         return self.relay_states.get(relay_id)
     
+    def get_states(self, relay_ids) -> Dict[str, Optional[bool]]:
+        """
+        Get the current state of several relays in a single call.
+        
+        Args:
+            relay_ids: Iterable of relay identifiers
+        
+        Returns:
+            Dict mapping relay_id to current state (None if relay not found)
+        """
+        relay_states = self.relay_states
+        return {relay_id: relay_states.get(relay_id) for relay_id in relay_ids}
+    
+    def read_states(self, relay_ids=None) -> Dict[str, bool]:
+        """
+        Read the output state of relays back from the GPIO devices.
+        
+        Resynchronizes the tracked relay states with the hardware in one pass.
+        
+        Args:
+            relay_ids: Iterable of relay identifiers, or None for all relays
+            
+        Returns:
+            Dict mapping relay_id to the state read from the device
+        """
+        if relay_ids is None:
+            relay_ids = self.relays.keys()
+        
+        states = {}
+        for relay_id in relay_ids:
+            state = bool(self.relays[relay_id].value)
+            self.relay_states[relay_id] = state
+            states[relay_id] = state
+        
+        return states
+    
     def get_all_states(self) -> Dict[str, bool]:
         """
         Get the current state of all relays.
@@ -185,18 +352,16 @@ class RelayController:
             bool: True if all relays turned off successfully
         """
         logger.info("Turning off all relays")
-        success = True
-        
-        for relay_id in self.relays:
-            if not self.set_state(relay_id, False):
-                success = False
-        
-        return success
+        return self.set_states(dict.fromkeys(self.relays, False))
     
     def close(self):
         """Clean up GPIO resources."""
         logger.info("Closing relay controller")
         
+        # Stop pending pulses so they cannot fire after cleanup
+        for relay_id in list(self._pulse_timers):
+            self._cancel_pulse(relay_id)
+        
         # Turn off all relays before closing
         self.turn_off_all()
         
@@ -219,6 +384,8 @@ class RelayController:
         self.close()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Test the relay controller
     print("=== Relay Controller Test ===")
     
@@ -242,6 +409,12 @@ if __name__ == "__main__":
                 print(f"  State: {controller.get_state(relay_id)}")
                 time.sleep(0.5)
             
+            # Test timed pulse
+            pulse_relay = next(iter(controller.relays))
+            success = controller.pulse(pulse_relay, 0.5)
+            print(f"\nPulse '{pulse_relay}' for 0.5s: {'✓' if success else '✗'}")
+            print(f"  State after pulse: {controller.get_state(pulse_relay)}")
+            
             # Test all states
             print(f"\nAll relay states: {controller.get_all_states()}")
             
@@ -6,9 +6,12 @@ Provides high-level control functions for pneumatic solenoid valves.
 Controls fill and exhaust valves through the relay controller.
 """
 
+import asyncio
 import logging
+import sys
 import time
-from typing import Optional
+from enum import IntEnum
+from typing import Callable, NamedTuple, Optional
 
 # Handle imports for both module use and standalone testing
 try:
@@ -18,9 +21,107 @@ except ImportError:
     from relay_controller import RelayController
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ValveId(IntEnum):
+    """Index of each solenoid valve in the per-valve setter and state tuples."""
+    FILL = 0
+    EXHAUST = 1
+
+# Relays that must exist on the relay controller for valve control,
+# ordered by ValveId
+REQUIRED_RELAYS = ("fill", "exhaust")
+
+class ValveStates(NamedTuple):
+    """Open/closed state of each solenoid valve (True=open, False=closed)."""
+    fill: bool
+    exhaust: bool
+
+def _make_valve_op(valve_id: ValveId, state: bool, summary: str) -> Callable:
+    """
+    Build a SolenoidValves method that drives one valve to a fixed state.
+    
+    Args:
+        valve_id: Valve to drive
+        state: True for an opening operation, False for a closing one
+        summary: First line of the generated method's docstring
+        
+    Returns:
+        Callable: Unbound method using the valve setter cached on the instance
+    """
+    index = int(valve_id)
+    valve = REQUIRED_RELAYS[index]
+    
+    if state:
+        def valve_op(self, duration: Optional[float] = None, force: bool = False) -> bool:
+            # Already open - skip the redundant relay write
+            if duration is None and not force and self._shadow[index]:
+                return True
+            
+            if duration:
+                logger.info("Opening %s valve for %ss", valve, duration)
+            else:
+                logger.info("Opening %s valve", valve)
+            
+            # If duration specified, pulse the relay so it is closed
+            # automatically even if the wait is interrupted
+            if duration is not None:
+                self._shadow[index] = True
+                try:
+                    return self.relay_controller.pulse(valve, duration)
+                finally:
+                    self._shadow[index] = bool(self.relay_controller.get_state(valve))
+            
+            self._setters[index](True)
+            self._shadow[index] = True
+            
+            return True
+        
+        valve_op.__doc__ = f"""
+        {summary}
+        
+        Args:
+            duration: Optional time in seconds to keep valve open.
+                     If None, valve stays open until manually closed.
+            force: Write the relay even if the valve is already open
+            
+        Returns:
+            bool: True if successful, False if error
+            
+        Raises:
+            Exception: Relay hardware errors are propagated to the caller
+        """
+        valve_op.__name__ = valve
+    else:
+        def valve_op(self, force: bool = False) -> bool:
+            # Already closed - skip the redundant relay write
+            if not force and not self._shadow[index]:
+                return True
+            
+            logger.info("Closing %s valve", valve)
+            
+            self._setters[index](False)
+            self._shadow[index] = False
+            
+            return True
+        
+        valve_op.__doc__ = f"""
+        {summary}
+        
+        Args:
+            force: Write the relay even if the valve is already closed
+            
+        Returns:
+            bool: True once the valve is closed
+            
+        Raises:
+            Exception: Relay hardware errors are propagated to the caller
+        """
+        valve_op.__name__ = f"stop_{valve}"
+    
+    valve_op.__qualname__ = f"SolenoidValves.{valve_op.__name__}"
+    return valve_op
+
 class SolenoidValves:
     """
     High-level controller for solenoid valves used in the leak test system.
@@ -38,140 +139,57 @@ class SolenoidValves:
         """
         self.relay_controller = relay_controller or RelayController()
         self._own_relay_controller = relay_controller is None
+        self._closed = False
         
         # Verify required relays are available
         self._verify_relays()
         
+        # Resolve the valve relays once so each valve operation skips the lookup;
+        # setters and shadow states are indexed by ValveId
+        self._setters = tuple(self.relay_controller.get_setter(relay_id) for relay_id in REQUIRED_RELAYS)
+        
+        # Shadow copy of the valve states, updated on every successful write
+        self._shadow = [False] * len(ValveId)
+        self.refresh_from_hardware()
+        
         logger.info("SolenoidValves controller initialized")
     
     def _verify_relays(self):
         """Verify that required relays are available."""
-        required_relays = ["fill", "exhaust"]
-        available_relays = list(self.relay_controller.relays.keys())
-        
-        for relay_id in required_relays:
-            if relay_id not in available_relays:
-                raise ValueError(f"Required relay '{relay_id}' not found in relay controller")
+        relays = self.relay_controller.relays
+        missing = [relay_id for relay_id in REQUIRED_RELAYS if relay_id not in relays]
+        if missing:
+            raise ValueError(f"Required relay '{missing[0]}' not found in relay controller")
         
-        logger.info(f"Verified solenoid relays: {required_relays}")
+        logger.info("Verified solenoid relays: %s", list(REQUIRED_RELAYS))
     
-    def fill(self, duration: Optional[float] = None) -> bool:
-        """
-        Open the fill valve to allow pressurization of the DUT.
-        
-        Args:
-            duration: Optional time in seconds to keep valve open.
-                     If None, valve stays open until manually closed.
-            
-        Returns:
-            bool: True if successful, False if error
-        """
-        logger.info(f"Opening fill valve" + (f" for {duration}s" if duration else ""))
-        
-        try:
-            # Turn on fill solenoid
-            success = self.relay_controller.set_state("fill", True)
-            if not success:
-                logger.error("Failed to open fill valve")
-                return False
-            
-            # If duration specified, wait then close automatically
-            if duration is not None:
-                time.sleep(duration)
-                return self.stop_fill()
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error controlling fill valve: {e}")
-            return False
+    # Valve operations generated by _make_valve_op
+    fill = _make_valve_op(ValveId.FILL, True, "Open the fill valve to allow pressurization of the DUT.")
+    stop_fill = _make_valve_op(ValveId.FILL, False, "Close the fill valve to stop pressurization.")
+    exhaust = _make_valve_op(ValveId.EXHAUST, True, "Open the exhaust valve to depressurize the DUT.")
+    stop_exhaust = _make_valve_op(ValveId.EXHAUST, False, "Close the exhaust valve to stop depressurization.")
     
-    def stop_fill(self) -> bool:
+    def close_all_valves(self, force: bool = False) -> bool:
         """
-        Close the fill valve to stop pressurization.
-        
-        Returns:
-            bool: True if successful, False if error
-        """
-        logger.info("Closing fill valve")
-        
-        try:
-            success = self.relay_controller.set_state("fill", False)
-            if not success:
-                logger.error("Failed to close fill valve")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error closing fill valve: {e}")
-            return False
-    
-    def exhaust(self, duration: Optional[float] = None) -> bool:
-        """
-        Open the exhaust valve to depressurize the DUT.
+        Safety function: Close all solenoid valves.
         
         Args:
-            duration: Optional time in seconds to keep valve open.
-                     If None, valve stays open until manually closed.
+            force: Write the relays even if both valves are already closed
             
         Returns:
-            bool: True if successful, False if error
-        """
-        logger.info(f"Opening exhaust valve" + (f" for {duration}s" if duration else ""))
-        
-        try:
-            # Turn on exhaust solenoid
-            success = self.relay_controller.set_state("exhaust", True)
-            if not success:
-                logger.error("Failed to open exhaust valve")
-                return False
-            
-            # If duration specified, wait then close automatically
-            if duration is not None:
-                time.sleep(duration)
-                return self.stop_exhaust()
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error controlling exhaust valve: {e}")
-            return False
-    
-    def stop_exhaust(self) -> bool:
-        """
-        Close the exhaust valve to stop depressurization.
-        
-        Returns:
-            bool: True if successful, False if error
+            bool: True if all valves closed successfully
         """
-        logger.info("Closing exhaust valve")
-        
-        try:
-            success = self.relay_controller.set_state("exhaust", False)
-            if not success:
-                logger.error("Failed to close exhaust valve")
-                return False
-            
+        # Both valves already closed - skip the redundant relay writes
+        if not force and not any(self._shadow):
+            logger.debug("All solenoid valves already closed")
             return True
-            
-        except Exception as e:
-            logger.error(f"Error closing exhaust valve: {e}")
-            return False
-    
-    def close_all_valves(self) -> bool:
-        """
-        Safety function: Close all solenoid valves.
         
-        Returns:
-            bool: True if all valves closed successfully
-        """
         logger.info("Closing all solenoid valves")
         
-        fill_success = self.stop_fill()
-        exhaust_success = self.stop_exhaust()
-        
-        success = fill_success and exhaust_success
+        # Drive both relays in one batched call instead of two round-trips
+        success = self.relay_controller.set_states({"fill": False, "exhaust": False})
+        states = self.relay_controller.get_states(REQUIRED_RELAYS)
+        self._shadow = [bool(states[relay_id]) for relay_id in REQUIRED_RELAYS]
         
         if success:
             logger.info("All solenoid valves closed successfully")
@@ -180,28 +198,44 @@ class SolenoidValves:
         
         return success
     
-    def get_valve_states(self) -> dict:
+    def get_valve_states(self) -> ValveStates:
         """
         Get the current state of all solenoid valves.
         
+        Returns the shadow state tracked from successful writes, so no
+        hardware I/O is performed. Use refresh_from_hardware() to resync.
+        
         Returns:
-            dict: Current state of each valve (True=open, False=closed)
+            ValveStates: Current state of each valve (True=open, False=closed)
         """
-        return {
-            "fill": self.relay_controller.get_state("fill"),
-            "exhaust": self.relay_controller.get_state("exhaust")
-        }
+        return ValveStates._make(self._shadow)
+    
+    def refresh_from_hardware(self) -> ValveStates:
+        """
+        Resynchronize the shadow valve states with the relay outputs.
+        
+        Returns:
+            ValveStates: Current state of each valve (True=open, False=closed)
+        """
+        states = self.relay_controller.read_states(REQUIRED_RELAYS)
+        self._shadow = [states[relay_id] for relay_id in REQUIRED_RELAYS]
+        return self.get_valve_states()
     
     def close(self):
-        """Clean up resources."""
-        logger.info("Closing solenoid valves controller")
+        """Clean up resources. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
         
-        # Close all valves before cleanup
-        self.close_all_valves()
+        logger.info("Closing solenoid valves controller")
         
-        # Only close relay controller if we created it
+        # Only close relay controller if we created it; closing it turns off
+        # every relay, so the valves need no separate write
         if self._own_relay_controller:
             self.relay_controller.close()
+        else:
+            # Shared controller - close the valves unless already closed
+            self.close_all_valves()
     
     def __enter__(self):
         """Context manager entry."""
@@ -211,15 +245,78 @@ class SolenoidValves:
         """Context manager exit - ensures cleanup."""
         self.close()
 
-if __name__ == "__main__":
-    # Manual solenoid valve control
+async def _read_line(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    Returns:
+        str: Line read including the newline, or "" at end of input
+    """
+    loop = asyncio.get_running_loop()
+    line = loop.create_future()
+    
+    def on_readable():
+        if not line.done():
+            line.set_result(sys.stdin.readline())
+    
+    try:
+        loop.add_reader(sys.stdin, on_readable)
+    except (NotImplementedError, PermissionError, ValueError):
+        # stdin cannot be polled (e.g. redirected file or Windows loop)
+        try:
+            return await asyncio.to_thread(input, prompt) + "\n"
+        except EOFError:
+            return ""
+    
+    print(prompt, end="", flush=True)
+    try:
+        return await line
+    finally:
+        loop.remove_reader(sys.stdin)
+
+async def _supervise_valves(valves: SolenoidValves, max_open_time: float, poll_interval: float = 0.5):
+    """
+    Close any valve left open longer than max_open_time during manual control.
+    
+    Args:
+        valves: Valves controller being operated from the menu
+        max_open_time: Maximum time in seconds a valve may stay open
+        poll_interval: Time in seconds between state checks
+    """
+    opened_at = {}
+    while True:
+        # A relay error must not end supervision: report it and keep polling
+        try:
+            now = time.monotonic()
+            for valve, is_open in valves.get_valve_states()._asdict().items():
+                if not is_open:
+                    opened_at.pop(valve, None)
+                elif now - opened_at.setdefault(valve, now) > max_open_time:
+                    print(f"\n⚠ {valve.capitalize()} valve open longer than {max_open_time:.0f}s - closing for safety")
+                    getattr(valves, f"stop_{valve}")()
+                    opened_at.pop(valve, None)
+        except Exception:
+            logger.exception("Valve supervision error")
+        await asyncio.sleep(poll_interval)
+
+async def main(max_open_time: float = 60.0):
+    """
+    Manual solenoid valve control menu.
+    
+    The prompt is read without blocking the event loop, so a supervisor task
+    keeps enforcing the maximum valve open time while waiting for input.
+    
+    Args:
+        max_open_time: Maximum time in seconds a valve may stay open
+    """
     print("=== Manual Solenoid Valve Control ===")
     print("Interactive control for testing valve hardware")
     
-    try:
-        with SolenoidValves() as valves:
-            print(f"\nInitial valve states: {valves.get_valve_states()}")
-            
+    with SolenoidValves() as valves:
+        print(f"\nInitial valve states: {valves.get_valve_states()}")
+        supervisor = asyncio.create_task(_supervise_valves(valves, max_open_time))
+        
+        try:
             while True:
                 print("\n--- Manual Control Menu ---")
                 print("1. Toggle FILL valve")
@@ -228,12 +325,16 @@ if __name__ == "__main__":
                 print("4. Close ALL valves (safety)")
                 print("5. Exit")
                 
+                line = await _read_line("\nEnter choice (1-5): ")
+                if not line:
+                    # End of input - treat as exit
+                    line = "5"
+                choice = line.strip()
+                
                 try:
-                    choice = input("\nEnter choice (1-5): ").strip()
-                    
                     if choice == "1":
                         # Toggle fill valve
-                        current_state = valves.get_valve_states()["fill"]
+                        current_state = valves.get_valve_states().fill
                         new_state = not current_state
                         
                         if new_state:
@@ -248,11 +349,11 @@ if __name__ == "__main__":
                         else:
                             print(f"✗ Failed to {action.lower()} fill valve")
                         
-                        print(f"Fill valve state: {'OPEN' if valves.get_valve_states()['fill'] else 'CLOSED'}")
+                        print(f"Fill valve state: {'OPEN' if valves.get_valve_states().fill else 'CLOSED'}")
                     
                     elif choice == "2":
                         # Toggle exhaust valve
-                        current_state = valves.get_valve_states()["exhaust"]
+                        current_state = valves.get_valve_states().exhaust
                         new_state = not current_state
                         
                         if new_state:
@@ -267,14 +368,14 @@ if __name__ == "__main__":
                         else:
                             print(f"✗ Failed to {action.lower()} exhaust valve")
                         
-                        print(f"Exhaust valve state: {'OPEN' if valves.get_valve_states()['exhaust'] else 'CLOSED'}")
+                        print(f"Exhaust valve state: {'OPEN' if valves.get_valve_states().exhaust else 'CLOSED'}")
                     
                     elif choice == "3":
                         # Show current states
                         states = valves.get_valve_states()
                         print(f"\nCurrent valve states:")
-                        print(f"  Fill valve:    {'OPEN' if states['fill'] else 'CLOSED'}")
-                        print(f"  Exhaust valve: {'OPEN' if states['exhaust'] else 'CLOSED'}")
+                        print(f"  Fill valve:    {'OPEN' if states.fill else 'CLOSED'}")
+                        print(f"  Exhaust valve: {'OPEN' if states.exhaust else 'CLOSED'}")
                     
                     elif choice == "4":
                         # Close all valves (safety)
@@ -286,7 +387,7 @@ if __name__ == "__main__":
                             print("✗ Failed to close one or more valves")
                         
                         states = valves.get_valve_states()
-                        print(f"Final states: Fill={'CLOSED' if not states['fill'] else 'OPEN'}, Exhaust={'CLOSED' if not states['exhaust'] else 'OPEN'}")
+                        print(f"Final states: Fill={'CLOSED' if not states.fill else 'OPEN'}, Exhaust={'CLOSED' if not states.exhaust else 'OPEN'}")
                     
                     elif choice == "5":
                         # Exit
@@ -298,18 +399,27 @@ if __name__ == "__main__":
                     else:
                         print("Invalid choice. Please enter 1-5.")
                 
-                except KeyboardInterrupt:
-                    print("\n\nKeyboard interrupt detected.")
-                    print("Closing all valves for safety...")
-                    valves.close_all_valves()
-                    print("✓ Manual control session ended safely")
-                    break
-                    
                 except Exception as e:
                     print(f"Error: {e}")
                     print("Closing all valves for safety...")
                     valves.close_all_valves()
-            
+        
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("\n\nKeyboard interrupt detected.")
+            print("Closing all valves for safety...")
+            valves.close_all_valves()
+            print("✓ Manual control session ended safely")
+        
+        finally:
+            supervisor.cancel()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         print(f"✗ Manual solenoid valve control failed: {e}")
-        exit(1) 
\ No newline at end of file
+        exit(1)
@@ -11,35 +11,59 @@ Troubleshoots pressure reading issues by testing each step of the conversion cha
 Run this script to identify where the pressure reading is failing.
 """
 
+import argparse
 import time
 import sys
 import os
 
+import numpy as np
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from controllers.adc_reader import ADCReader
-from controllers.pressure_calibration import PressureCalibration
+# Controller modules are imported where they are first needed, so the
+# configuration check can run without loading the hardware stack
 from config.config_manager import get_config_manager
 
+# Separator lines, built once
+_H_BAR = "=" * 60
+_SH_BAR = "-" * 40
+_MAIN_BAR = "=" * 80
+
+TROUBLESHOOTING_TEXT = f"""
+{_MAIN_BAR}
+TROUBLESHOOTING GUIDE
+{_MAIN_BAR}
+
+If you're getting 0 PSI readings:
+1. Check if Raw ADC values are 0 - indicates hardware/wiring issue
+2. Check if Current is below 4mA - indicates sensor or power issue
+3. Check if Current is valid but Pressure is 0 - indicates calibration issue
+4. Verify your pressure transducer is actually connected and powered
+5. Check I2C connections between Pi and ADC module
+6. Verify 4-20mA loop is complete and powered
+
+Expected values at 0.5 PSI:
+- Raw ADC: ~19,292 (for 12mA)
+- Current: ~12.029 mA
+- Pressure: ~0.5 PSI
+"""
+
 def diagnostic_header(title):
     """Print a diagnostic section header."""
-    print(f"\n{'='*60}")
-    print(f"{title}")
-    print(f"{'='*60}")
+    print(f"\n{_H_BAR}\n{title}\n{_H_BAR}")
 
 def diagnostic_subheader(title):
     """Print a diagnostic subsection header."""
-    print(f"\n{'-'*40}")
-    print(f"{title}")
-    print(f"{'-'*40}")
+    print(f"\n{_SH_BAR}\n{title}\n{_SH_BAR}")
 
-def test_configuration():
+def test_configuration(config_manager=None):
     """Test configuration loading and validation."""
     diagnostic_header("CONFIGURATION VALIDATION")
     
     try:
-        config_manager = get_config_manager()
+        if config_manager is None:
+            config_manager = get_config_manager()
         
         # Test pressure calibration config
         cal_config = config_manager.pressure_calibration
@@ -67,13 +91,15 @@ def test_configuration():
         print(f"✗ Configuration error: {e}")
         return False
 
-def test_adc_reader():
+def test_adc_reader(adc=None):
     """Test ADC reader functionality."""
     diagnostic_header("ADC READER TEST")
     
     try:
-        # Initialize ADC reader
-        adc = ADCReader()
+        # Initialize ADC reader unless a shared one was provided
+        if adc is None:
+            from controllers.adc_reader import ADCReader
+            adc = ADCReader()
         
         # Show ADC info
         adc_info = adc.get_adc_info()
@@ -86,30 +112,35 @@ def test_adc_reader():
         
         diagnostic_subheader("Raw ADC Readings")
         
-        # Test raw ADC readings
-        for i in range(5):
-            raw_value = adc.read_raw_value()
-            voltage = adc.read_voltage()
-            print(f"  Reading {i+1}: Raw={raw_value:5d}, Voltage={voltage:.3f}V")
-            time.sleep(0.2)
+        # Test raw ADC readings - one burst, voltages derived from the same samples
+        raw_values = adc.read_raw_burst(5)
+        bursts_complete = len(raw_values) == 5
+        if not bursts_complete:
+            print(f"  ✗ ADC read failed after {len(raw_values)} of 5 readings")
+        voltages = adc.raw_to_voltage(raw_values)
+        print("\n".join(
+            f"  Reading {i+1}: Raw={raw_value:5d}, Voltage={voltage:.3f}V"
+            for i, (raw_value, voltage) in enumerate(zip(raw_values, voltages))
+        ))
         
         diagnostic_subheader("Current Conversion Test")
         
-        # Test current conversion
-        for i in range(5):
-            raw_value = adc.read_raw_value()
-            current = adc.read_current_ma()
-            expected_current = adc.raw_adc_to_current_ma(raw_value)
-            
-            print(f"  Reading {i+1}: Raw={raw_value:5d} → Current={current:.3f}mA (Expected={expected_current:.3f}mA)")
+        # Test current conversion - one burst, currents derived from the same samples
+        raw_values = adc.read_raw_burst(5)
+        if len(raw_values) < 5:
+            bursts_complete = False
+            print(f"  ✗ ADC read failed after {len(raw_values)} of 5 readings")
+        currents = adc.raw_adc_to_current_ma(raw_values)
+        lines = []
+        for i, (raw_value, current) in enumerate(zip(raw_values, currents)):
+            lines.append(f"  Reading {i+1}: Raw={raw_value:5d} → Current={current:.3f}mA")
             
             # Check if current is in expected range
             if 4.0 <= current <= 20.0:
-                print(f"    ✓ Current is in valid 4-20mA range")
+                lines.append("    ✓ Current is in valid 4-20mA range")
             else:
-                print(f"    ✗ Current is outside 4-20mA range!")
-            
-            time.sleep(0.2)
+                lines.append("    ✗ Current is outside 4-20mA range!")
+        print("\n".join(lines))
         
         diagnostic_subheader("ADC Module Calibration Check")
         
@@ -120,23 +151,26 @@ def test_adc_reader():
             (32154, "20mA (module maximum)")
         ]
         
-        for raw_val, description in test_values:
-            current = adc.raw_adc_to_current_ma(raw_val)
+        currents = adc.raw_adc_to_current_ma(np.array([raw_val for raw_val, _ in test_values]))
+        for (raw_val, description), current in zip(test_values, currents):
             print(f"  {description}: Raw={raw_val} → {current:.3f}mA")
         
-        return True
+        # A short burst means an ADC read failed
+        return bursts_complete
         
     except Exception as e:
         print(f"✗ ADC reader error: {e}")
         return False
 
-def test_pressure_calibration():
+def test_pressure_calibration(calibration=None):
     """Test pressure calibration functionality."""
     diagnostic_header("PRESSURE CALIBRATION TEST")
     
     try:
-        # Initialize pressure calibration
-        calibration = PressureCalibration()
+        # Initialize pressure calibration unless a shared one was provided
+        if calibration is None:
+            from controllers.pressure_calibration import PressureCalibration
+            calibration = PressureCalibration()
         
         # Show calibration info
         cal_info = calibration.get_calibration_info()
@@ -159,67 +193,111 @@ def test_pressure_calibration():
             (16.0, "Three-quarter scale (~0.75 PSI)")
         ]
         
-        for current, description in test_currents:
-            pressure = calibration.current_to_pressure(current)
+        pressures = calibration.current_to_pressure_batch([current for current, _ in test_currents])
+        for (current, description), pressure in zip(test_currents, pressures):
             print(f"  {current:.3f}mA ({description}) → {pressure:.4f} PSI")
         
         diagnostic_subheader("Live Pressure Readings")
         
-        # Test live pressure readings
-        for i in range(10):
-            pressure = calibration.read_pressure_psi(num_samples=1)
+        # Test live pressure readings - one burst of individual samples
+        pressures = calibration.read_pressures_psi(10)
+        for i, pressure in enumerate(pressures):
             print(f"  Reading {i+1}: {pressure:.4f} PSI")
-            time.sleep(0.5)
         
-        return True
+        if len(pressures) < 10:
+            print(f"  ✗ ADC read failed after {len(pressures)} of 10 readings")
+        if len(pressures) == 0:
+            return False
+        
+        print(f"  Mean: {pressures.mean():.4f} PSI, Std dev: {pressures.std():.4f} PSI, "
+              f"Range: {np.ptp(pressures):.4f} PSI")
+        
+        return len(pressures) == 10
         
     except Exception as e:
         print(f"✗ Pressure calibration error: {e}")
         return False
 
-def test_complete_chain():
-    """Test the complete ADC to pressure conversion chain."""
+def test_complete_chain(adc=None, calibration=None, interval=0.5):
+    """
+    Test the complete ADC to pressure conversion chain.
+    
+    Args:
+        adc: Shared ADC reader, or None to use the calibration's
+        calibration: Shared pressure calibration, or None to create one
+        interval: Delay in seconds between readings (0 for no delay)
+    """
     diagnostic_header("COMPLETE CONVERSION CHAIN TEST")
     
     try:
-        # Initialize both components
-        adc = ADCReader()
-        calibration = PressureCalibration()
+        # Initialize both components unless shared ones were provided,
+        # sharing one ADC reader between them
+        if calibration is None:
+            from controllers.pressure_calibration import PressureCalibration
+            calibration = PressureCalibration(adc_reader=adc)
+        if adc is None:
+            adc = calibration.adc_reader
         
         diagnostic_subheader("Step-by-Step Conversion")
         
-        for i in range(5):
-            # Step 1: Read raw ADC
-            raw_value = adc.read_raw_value()
+        # Let the ADC convert in the background so each reading is just a fetch
+        adc.start_conversion()
+        
+        # Readings are collected for summary statistics after the loop
+        num_readings = 5
+        raw_values = np.empty(num_readings, dtype=np.int32)
+        voltages = np.empty(num_readings)
+        currents = np.empty(num_readings)
+        
+        for i in range(num_readings):
+            # Step 1: Read raw ADC (latest conversion, reused by the following steps)
+            raw_value = adc.read_last()
             
             # Step 2: Convert to voltage
-            voltage = adc.read_voltage()
+            voltage = adc.raw_to_voltage(raw_value)
             
             # Step 3: Convert to current
-            current = adc.read_current_ma()
+            current = adc.raw_adc_to_current_ma(raw_value)
             
             # Step 4: Convert to pressure
-            pressure = calibration.current_to_pressure(current)
+            pressure = calibration.pressure_from_raw(raw_value)
             
             # Step 5: Direct pressure reading
             direct_pressure = calibration.read_pressure_psi(num_samples=1)
             
-            print(f"  Reading {i+1}:")
-            print(f"    Raw ADC: {raw_value}")
-            print(f"    Voltage: {voltage:.3f} V")
-            print(f"    Current: {current:.3f} mA")
-            print(f"    Pressure (calculated): {pressure:.4f} PSI")
-            print(f"    Pressure (direct): {direct_pressure:.4f} PSI")
+            raw_values[i] = raw_value
+            voltages[i] = voltage
+            currents[i] = current
+            
+            lines = [
+                f"  Reading {i+1}:",
+                f"    Raw ADC: {raw_value}",
+                f"    Voltage: {voltage:.3f} V",
+                f"    Current: {current:.3f} mA",
+                f"    Pressure (calculated): {pressure:.4f} PSI",
+                f"    Pressure (direct): {direct_pressure:.4f} PSI"
+            ]
             
             # Check for issues
             if raw_value == 0:
-                print(f"    ✗ WARNING: Raw ADC is 0 - check hardware connection")
+                lines.append("    ✗ WARNING: Raw ADC is 0 - check hardware connection")
             if current < 4.0:
-                print(f"    ✗ WARNING: Current below 4mA - check sensor/wiring")
+                lines.append("    ✗ WARNING: Current below 4mA - check sensor/wiring")
             if pressure == 0.0 and current > 4.0:
-                print(f"    ✗ WARNING: Pressure is 0 but current is valid - check calibration")
+                lines.append("    ✗ WARNING: Pressure is 0 but current is valid - check calibration")
+            
+            # Emit the whole reading in one write
+            print("\n".join(lines))
             
-            time.sleep(0.5)
+            if interval > 0:
+                time.sleep(interval)
+        
+        diagnostic_subheader("Reading Statistics")
+        print("\n".join([
+            f"  Raw ADC: mean {raw_values.mean():.1f}, std dev {raw_values.std():.1f}, range {np.ptp(raw_values)}",
+            f"  Voltage: mean {voltages.mean():.3f} V, std dev {voltages.std():.4f} V",
+            f"  Current: mean {currents.mean():.3f} mA, std dev {currents.std():.4f} mA"
+        ]))
         
         return True
         
@@ -227,25 +305,50 @@ def test_complete_chain():
         print(f"✗ Complete chain test error: {e}")
         return False
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Pressure reading diagnostic")
+    parser.add_argument("--interval", type=float, default=0.5,
+                        help="delay in seconds between live readings (default: 0.5)")
+    parser.add_argument("--no-sleep", "--fast", dest="no_sleep", action="store_true",
+                        help="take readings back-to-back, e.g. for automated runs")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Run complete pressure diagnostic."""
+    args = parse_args(argv)
+    interval = 0.0 if args.no_sleep else args.interval
+    
     print("PRESSURE READING DIAGNOSTIC")
     print("This script will test each step of the pressure reading system")
     print("to identify where the issue is occurring.")
     
+    # Create the configuration and hardware objects once and share them
+    # between tests; a test creates its own if shared setup failed.
+    # The ADC tests use the calibration's configured ADC reader, so the
+    # ADC is only initialized once
+    config_manager = get_config_manager()
+    adc = calibration = None
+    try:
+        from controllers.pressure_calibration import PressureCalibration
+        calibration = PressureCalibration()
+        adc = calibration.adc_reader
+    except Exception as e:
+        print(f"✗ Shared hardware initialization failed: {e}")
+    
     # Run all diagnostic tests
     tests = [
-        ("Configuration", test_configuration),
-        ("ADC Reader", test_adc_reader),
-        ("Pressure Calibration", test_pressure_calibration),
-        ("Complete Chain", test_complete_chain)
+        ("Configuration", lambda: test_configuration(config_manager)),
+        ("ADC Reader", lambda: test_adc_reader(adc)),
+        ("Pressure Calibration", lambda: test_pressure_calibration(calibration)),
+        ("Complete Chain", lambda: test_complete_chain(adc, calibration, interval))
     ]
     
     results = {}
     
     for test_name, test_func in tests:
         try:
-            print(f"\n{'='*80}")
+            print(f"\n{_MAIN_BAR}")
             print(f"Running {test_name} test...")
             success = test_func()
             results[test_name] = success
@@ -260,30 +363,13 @@ def main():
             results[test_name] = False
     
     # Summary
-    print(f"\n{'='*80}")
-    print("DIAGNOSTIC SUMMARY")
-    print(f"{'='*80}")
-    
-    for test_name, success in results.items():
-        status = "✓ PASS" if success else "✗ FAIL"
-        print(f"{test_name:<20}: {status}")
-    
-    print(f"\n{'='*80}")
-    print("TROUBLESHOOTING GUIDE")
-    print(f"{'='*80}")
-    
-    print("\nIf you're getting 0 PSI readings:")
-    print("1. Check if Raw ADC values are 0 - indicates hardware/wiring issue")
-    print("2. Check if Current is below 4mA - indicates sensor or power issue")
-    print("3. Check if Current is valid but Pressure is 0 - indicates calibration issue")
-    print("4. Verify your pressure transducer is actually connected and powered")
-    print("5. Check I2C connections between Pi and ADC module")
-    print("6. Verify 4-20mA loop is complete and powered")
+    print(f"\n{_MAIN_BAR}\nDIAGNOSTIC SUMMARY\n{_MAIN_BAR}")
+    print("\n".join(
+        f"{test_name:<20}: {'✓ PASS' if success else '✗ FAIL'}"
+        for test_name, success in results.items()
+    ))
     
-    print("\nExpected values at 0.5 PSI:")
-    print("- Raw ADC: ~19,292 (for 12mA)")
-    print("- Current: ~12.029 mA")
-    print("- Pressure: ~0.5 PSI")
+    sys.stdout.write(TROUBLESHOOTING_TEXT)
     
     if not results.get("ADC Reader", False):
         print("\n⚠️  ADC Reader failed - check hardware connections!")
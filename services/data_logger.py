@@ -6,19 +6,57 @@ Comprehensive data logging system for the EOL Leak Tester.
 Records test results, pressure data, and system events to CSV files.
 """
 
+import atexit
 import csv
 import os
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import attrgetter, itemgetter
+
+import numpy as np
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of pressure readings the in-memory test buffer holds; once full it
+# is thinned to every other reading so memory stays bounded on long tests
+PRESSURE_BUFFER_SIZE = 65536
+
+# Write buffer size of the open log files; large enough that high-rate pressure
+# logging reaches the disk (often an SD card) in few, large writes
+LOG_FILE_BUFFER_SIZE = 1 << 20
+
+# CSV headers of the daily test result, pressure data and summary files
+TEST_RESULTS_HEADER = [
+    'timestamp', 'test_id', 'result', 'duration', 'start_pressure',
+    'end_pressure', 'pressure_drop', 'leak_rate', 'max_pressure_reached',
+    'target_fill_pressure', 'max_leak_rate_allowed', 'cylinder_extend_time',
+    'fill_time', 'stabilize_time', 'test_duration', 'exhaust_time',
+    'cylinder_retract_time', 'notes'
+]
+PRESSURE_DATA_HEADER = [
+    'timestamp', 'test_id', 'phase_id', 'elapsed_time',
+    'pressure_psi', 'raw_current_ma'
+]
+# Test result columns used for statistics and daily summaries
+RESULT_STAT_COLUMNS = (
+    'timestamp', 'result', 'duration', 'leak_rate',
+    'start_pressure', 'max_pressure_reached', 'pressure_drop'
+)
+DAILY_SUMMARY_HEADER = [
+    'date', 'total_tests', 'pass_count', 'fail_count', 'error_count',
+    'pass_rate', 'avg_test_duration', 'avg_leak_rate', 'min_pressure',
+    'max_pressure', 'avg_pressure_drop'
+]
+
 @dataclass
 class TestRecord:
     """Data class for test result records."""
@@ -60,6 +98,10 @@ class SystemEvent:
     event: str
     details: str = ""
 
+# CSV row extractors: return a record's field values in column order
+_TEST_RECORD_ROW = attrgetter(*(field.name for field in fields(TestRecord)))
+_SYSTEM_EVENT_ROW = attrgetter(*(field.name for field in fields(SystemEvent)))
+
 class DataLogger:
     """
     Data logging service for the EOL Leak Tester.
@@ -71,53 +113,96 @@ class DataLogger:
     - Performance metrics
     """
     
-    def __init__(self, log_directory: str = "data/logs"):
+    def __init__(self,
+                 log_directory: str = "data/logs",
+                 pressure_batch_size: int = 64,
+                 force_flush_after: float = 0.5,
+                 fsync_results: bool = True):
         """
         Initialize the data logger.
         
         Args:
             log_directory: Directory to store log files
+            pressure_batch_size: Maximum number of queued rows the background
+                                writer writes in one batch
+            force_flush_after: Maximum time in seconds written rows stay in the
+                              file buffers before the background writer
+                              flushes them to the operating system
+            fsync_results: Flush and fsync each test result row to disk as soon
+                          as it is written. Pressure readings and system events
+                          are never fsynced; they stay on the buffered path.
         """
         self.log_directory = Path(log_directory)
+        self.fsync_results = fsync_results
         self.current_test_id = None
         self.current_test_data = {}
         
         # Create log directory if it doesn't exist
         self.log_directory.mkdir(parents=True, exist_ok=True)
         
-        # Define file paths
-        self.test_results_file = self.log_directory / "test_results.csv"
-        self.pressure_data_file = self.log_directory / "pressure_data.csv"
+        # Define file paths. Test results, pressure data and daily summaries
+        # go to one file per day (see _dated_file); test_results_file and
+        # pressure_data_file always point at the file currently written.
         self.system_events_file = self.log_directory / "system_events.csv"
-        self.daily_summary_file = self.log_directory / f"daily_summary_{datetime.now().strftime('%Y%m%d')}.csv"
+        self.phase_legend_file = self.log_directory / "phase_legend.csv"
+        self.daily_summary_file = self._dated_file("daily_summary", datetime.now())
         
         # Initialize CSV files with headers
         self._initialize_csv_files()
         
+        # Keep the append-only CSV files open with large buffers and reuse
+        # their writers instead of reopening the file for every row
+        self._open_pressure_file(time.time())
+        self._events_fh = open(self.system_events_file, 'a', newline='', encoding='utf-8',
+                               buffering=LOG_FILE_BUFFER_SIZE)
+        self._events_writer = csv.writer(self._events_fh)
+        self._open_results_file(datetime.now())
+        self._closed = False
+        
+        # Per-day result counters for the daily summary, seeded once from
+        # today's results (dated and pre-rotation files) and then updated as
+        # each test result is logged
+        self._daily_stats: Dict[str, Dict[str, float]] = {}
+        self._load_daily_stats()
+        
+        # Phases are stored as small integer ids; the mapping is kept in the
+        # phase legend file
+        self._phase_ids: Dict[str, int] = {}
+        self._phase_names: List[str] = []
+        self._load_phase_legend()
+        
+        # In-memory pressure readings of the current test, stored column-wise
+        # and reused across tests. Every _pres_stride-th reading is kept.
+        self._allocate_pressure_buffer(PRESSURE_BUFFER_SIZE)
+        self._pres_n = 0
+        self._pres_count = 0
+        self._pres_stride = 1
+        
+        # Cached (second, date/time prefix) for timestamps; kept as a single
+        # tuple so the caller and writer threads never see a mismatched pair
+        self._ts_cache = (-1, '')
+        
+        # Pressure readings and system events are written by a background
+        # thread so logging never blocks the caller on disk I/O
+        self._write_batch_limit = pressure_batch_size
+        self._force_flush_after = force_flush_after
+        self._queue = queue.Queue(maxsize=4096)
+        self._dropped_rows = 0
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="DataLoggerWriter", daemon=True)
+        self._writer_thread.start()
+        
+        # Make sure buffered rows reach disk on interpreter exit
+        atexit.register(self.close)
+        
         logger.info(f"DataLogger initialized with log directory: {self.log_directory}")
         
     def _initialize_csv_files(self):
         """Initialize CSV files with appropriate headers."""
-        # Test results file
-        if not self.test_results_file.exists():
-            with open(self.test_results_file, 'w', newline='') as f:
+        # Phase legend file (phase_id -> phase name for the pressure data files)
+        if not self.phase_legend_file.exists():
+            with open(self.phase_legend_file, 'w', newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'test_id', 'result', 'duration', 'start_pressure',
-                    'end_pressure', 'pressure_drop', 'leak_rate', 'max_pressure_reached',
-                    'target_fill_pressure', 'max_leak_rate_allowed', 'cylinder_extend_time',
-                    'fill_time', 'stabilize_time', 'test_duration', 'exhaust_time',
-                    'cylinder_retract_time', 'notes'
-                ])
-        
-        # Pressure data file
-        if not self.pressure_data_file.exists():
-            with open(self.pressure_data_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'test_id', 'phase', 'elapsed_time',
-                    'pressure_psi', 'raw_current_ma'
-                ])
+                writer.writerow(['phase_id', 'phase'])
         
         # System events file
         if not self.system_events_file.exists():
@@ -131,11 +216,61 @@ class DataLogger:
         if not self.daily_summary_file.exists():
             with open(self.daily_summary_file, 'w', newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    'date', 'total_tests', 'pass_count', 'fail_count', 'error_count',
-                    'pass_rate', 'avg_test_duration', 'avg_leak_rate', 'min_pressure',
-                    'max_pressure', 'avg_pressure_drop'
-                ])
+                writer.writerow(DAILY_SUMMARY_HEADER)
+    
+    def _dated_file(self, prefix: str, day: datetime) -> Path:
+        """
+        Get the path of a per-day log file.
+        
+        Args:
+            prefix: File name prefix (e.g. 'pressure_data')
+            day: Any time on the day of the file
+            
+        Returns:
+            Path: log_directory/<prefix>_YYYYMMDD.csv
+        """
+        return self.log_directory / f"{prefix}_{day.strftime('%Y%m%d')}.csv"
+    
+    def _open_dated_csv(self, path: Path, header: List[str]):
+        """
+        Open a per-day CSV file for appending, writing its header if it is new.
+        
+        Args:
+            path: File path
+            header: Column names for a new file
+            
+        Returns:
+            Open file handle
+        """
+        fh = open(path, 'a', newline='', encoding='utf-8', buffering=LOG_FILE_BUFFER_SIZE)
+        if fh.tell() == 0:
+            csv.writer(fh).writerow(header)
+        return fh
+    
+    def _open_pressure_file(self, now: float):
+        """
+        Open the pressure data file for the day of the given time.
+        
+        Args:
+            now: Seconds since the epoch
+        """
+        day = datetime.fromtimestamp(now)
+        self.pressure_data_file = self._dated_file("pressure_data", day)
+        self._pressure_fh = self._open_dated_csv(self.pressure_data_file, PRESSURE_DATA_HEADER)
+        midnight = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._pressure_rollover_at = (midnight + timedelta(days=1)).timestamp()
+    
+    def _open_results_file(self, day: datetime):
+        """
+        Open the test results file for the given day.
+        
+        Args:
+            day: Any time on the day of the file
+        """
+        self.test_results_file = self._dated_file("test_results", day)
+        self._results_fh = self._open_dated_csv(self.test_results_file, TEST_RESULTS_HEADER)
+        self._results_writer = csv.writer(self._results_fh)
+        self._results_day = day.date()
     
     def start_test_session(self, config: Dict[str, Any]) -> str:
         """
@@ -156,10 +291,14 @@ class DataLogger:
             'test_id': self.current_test_id,
             'start_time': timestamp,
             'config': config,
-            'pressure_readings': [],
             'events': []
         }
         
+        # Start a fresh pressure buffer
+        self._pres_n = 0
+        self._pres_count = 0
+        self._pres_stride = 1
+        
         # Log test start event
         self.log_system_event('INFO', 'TestRunner', f'Test session started: {self.current_test_id}')
         
@@ -184,31 +323,255 @@ class DataLogger:
             logger.warning("No active test session for pressure reading")
             return
         
-        timestamp = datetime.now().isoformat()
+        now = time.time()
         
-        # Create pressure reading record
-        reading = PressureReading(
-            timestamp=timestamp,
-            test_id=self.current_test_id,
-            phase=phase,
-            elapsed_time=elapsed_time,
-            pressure_psi=pressure_psi,
-            raw_current_ma=raw_current_ma
-        )
+        phase_id = self._phase_ids.get(phase)
+        if phase_id is None:
+            phase_id = self._add_phase(phase)
         
-        # Store in current test data
-        self.current_test_data['pressure_readings'].append(asdict(reading))
+        # Store in the current test's pressure buffer
+        count = self._pres_count
+        self._pres_count = count + 1
+        if count % self._pres_stride == 0:
+            if self._pres_n == PRESSURE_BUFFER_SIZE:
+                self._thin_pressure_buffer()
+            n = self._pres_n
+            self._pres_time[n] = now
+            self._pres_elapsed[n] = elapsed_time
+            self._pres_psi[n] = pressure_psi
+            self._pres_ma[n] = raw_current_ma
+            self._pres_phase_idx[n] = phase_id
+            self._pres_n = n + 1
         
-        # Write to CSV file
+        # Hand off to the background writer as one flat tuple; the timestamp
+        # string is formatted there, off the sampling path
+        self._enqueue('P', (
+            now, self.current_test_id, phase_id,
+            elapsed_time, pressure_psi, raw_current_ma
+        ))
+    
+    def _load_phase_legend(self):
+        """Load the phase id mapping from the phase legend file."""
         try:
-            with open(self.pressure_data_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    reading.timestamp, reading.test_id, reading.phase,
-                    reading.elapsed_time, reading.pressure_psi, reading.raw_current_ma
-                ])
+            with open(self.phase_legend_file, 'r') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                for row in reader:
+                    if len(row) >= 2 and int(row[0]) == len(self._phase_names):
+                        self._phase_ids[row[1]] = len(self._phase_names)
+                        self._phase_names.append(row[1])
         except Exception as e:
-            logger.error(f"Failed to write pressure reading to CSV: {e}")
+            logger.error(f"Failed to load phase legend: {e}")
+    
+    def _add_phase(self, phase: str) -> int:
+        """
+        Assign the next phase id to a new phase and record it in the legend file.
+        
+        Args:
+            phase: Phase name
+            
+        Returns:
+            int: Phase id
+        """
+        phase_id = len(self._phase_names)
+        self._phase_ids[phase] = phase_id
+        self._phase_names.append(phase)
+        
+        try:
+            with open(self.phase_legend_file, 'a', newline='') as f:
+                csv.writer(f).writerow([phase_id, phase])
+        except Exception as e:
+            logger.error(f"Failed to update phase legend: {e}")
+        
+        return phase_id
+    
+    def _allocate_pressure_buffer(self, size: int):
+        """
+        Allocate empty pressure buffer columns.
+        
+        Args:
+            size: Number of readings the buffer can hold
+        """
+        self._pres_time = np.empty(size, dtype=np.float64)
+        self._pres_elapsed = np.empty(size, dtype=np.float64)
+        self._pres_psi = np.empty(size, dtype=np.float64)
+        self._pres_ma = np.empty(size, dtype=np.float64)
+        self._pres_phase_idx = np.empty(size, dtype=np.uint16)
+    
+    def _thin_pressure_buffer(self):
+        """Drop every other buffered reading and halve the rate new ones are kept at."""
+        n = self._pres_n
+        kept = (n + 1) // 2
+        for col in (self._pres_time, self._pres_elapsed, self._pres_psi, self._pres_ma, self._pres_phase_idx):
+            col[:kept] = col[:n:2]
+        self._pres_n = kept
+        self._pres_stride *= 2
+    
+    def _save_pressure_archive(self, archive_file: Path, test_arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Save the buffered pressure readings of the current test as a compressed archive.
+        
+        Timestamps are stored as delta-of-delta integer microseconds and the
+        float columns XOR'ed with their previous value, which turns the
+        regularly sampled, slowly changing data into mostly zero bits that
+        compress well. Use load_pressure_archive() to decode.
+        
+        Args:
+            archive_file: Destination .npz file
+            test_arrays: Extra arrays from the test data, stored as-is under
+                a 'test_' prefix
+        """
+        extra = {f'test_{key}': value for key, value in (test_arrays or {}).items()}
+        n = self._pres_n
+        time_us = np.rint(self._pres_time[:n] * 1e6).astype(np.int64)
+        np.savez_compressed(
+            archive_file,
+            time_us_dod=np.diff(np.diff(time_us, prepend=0), prepend=0),
+            elapsed_time_xor=_xor_encode(self._pres_elapsed[:n]),
+            pressure_psi_xor=_xor_encode(self._pres_psi[:n]),
+            raw_current_ma_xor=_xor_encode(self._pres_ma[:n]),
+            phase_idx=self._pres_phase_idx[:n],
+            phases=np.array(self._phase_names, dtype=str),
+            **extra
+        )
+    
+    def _format_timestamp(self, now: float) -> str:
+        """
+        Format an epoch time as a local ISO-8601 string.
+        
+        The date/time part only changes once per second, so it is cached and
+        only the microseconds are formatted per call.
+        
+        Args:
+            now: Seconds since the epoch (time.time())
+            
+        Returns:
+            str: Timestamp in the same format as datetime.isoformat()
+        """
+        second = int(now)
+        cached_second, prefix = self._ts_cache
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+            self._ts_cache = (second, prefix)
+        return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+    
+    def _enqueue(self, kind: str, row: Any):
+        """
+        Queue a row (or a FLUSH/STOP request) for the background writer.
+        
+        Rows never block the caller: if the writer has fallen behind and the
+        queue is full, the row is dropped and counted. FLUSH/STOP requests
+        wait for room, since callers rely on them being processed.
+        """
+        if self._closed:
+            logger.warning("Data logger is closed - row not logged")
+            return
+        if kind in ('FLUSH', 'STOP'):
+            self._queue.put((kind, row))
+            return
+        try:
+            self._queue.put_nowait((kind, row))
+        except queue.Full:
+            self._dropped_rows += 1
+            if self._dropped_rows % 1000 == 1:
+                logger.warning(f"Data logger queue full - {self._dropped_rows} row(s) dropped")
+    
+    def _writer_loop(self):
+        """Background thread: write queued pressure and event rows in batches."""
+        q = self._queue
+        dirty = False
+        flush_due = 0.0
+        
+        while True:
+            try:
+                items = [q.get(timeout=self._force_flush_after)]
+            except queue.Empty:
+                # Idle - push written rows to the operating system
+                if dirty:
+                    self._flush_writer_files()
+                    dirty = False
+                continue
+            
+            # Drain whatever else is already waiting
+            while len(items) < self._write_batch_limit:
+                try:
+                    items.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = False
+            pressure_rows = []
+            event_rows = []
+            for kind, row in items:
+                if kind == 'P':
+                    pressure_rows.append(row)
+                elif kind == 'E':
+                    event_rows.append(row)
+                else:
+                    # FLUSH or STOP: write everything queued before it first
+                    self._write_rows(pressure_rows, event_rows)
+                    pressure_rows = []
+                    event_rows = []
+                    self._flush_writer_files()
+                    dirty = False
+                    stop = stop or kind == 'STOP'
+            
+            if pressure_rows or event_rows:
+                self._write_rows(pressure_rows, event_rows)
+                if not dirty:
+                    dirty = True
+                    flush_due = time.monotonic() + self._force_flush_after
+            
+            # Under sustained load the queue never goes idle, so also flush
+            # once the oldest unflushed rows have waited force_flush_after
+            if dirty and time.monotonic() >= flush_due:
+                self._flush_writer_files()
+                dirty = False
+            
+            for _ in items:
+                q.task_done()
+            
+            if stop:
+                return
+    
+    def _write_rows(self, pressure_rows: List[tuple], event_rows: List[tuple]):
+        """Write batches of pressure and event rows (background writer only)."""
+        if pressure_rows:
+            try:
+                # Switch to the next day's file at midnight
+                while pressure_rows[-1][0] >= self._pressure_rollover_at:
+                    split = next(i for i, row in enumerate(pressure_rows) if row[0] >= self._pressure_rollover_at)
+                    self._write_pressure_rows(pressure_rows[:split])
+                    self._pressure_fh.close()
+                    self._open_pressure_file(pressure_rows[split][0])
+                    pressure_rows = pressure_rows[split:]
+                self._write_pressure_rows(pressure_rows)
+            except Exception as e:
+                logger.error(f"Failed to write pressure readings to CSV: {e}")
+        if event_rows:
+            try:
+                self._events_writer.writerows(event_rows)
+            except Exception as e:
+                logger.error(f"Failed to write system events to CSV: {e}")
+    
+    def _write_pressure_rows(self, pressure_rows: List[tuple]):
+        """Format and write pressure rows to the current pressure data file."""
+        # Fixed schema with no delimiters in any field, so rows are formatted
+        # directly instead of going through csv.writer; \r\n matches the csv
+        # module default
+        format_timestamp = self._format_timestamp
+        self._pressure_fh.write("".join(
+            f"{format_timestamp(now)},{test_id},{phase_id},{elapsed_time:.3f},{pressure_psi:.4f},{raw_current_ma:.3f}\r\n"
+            for now, test_id, phase_id, elapsed_time, pressure_psi, raw_current_ma in pressure_rows
+        ))
+    
+    def _flush_writer_files(self):
+        """Flush the files owned by the background writer."""
+        for fh in (self._pressure_fh, self._events_fh):
+            try:
+                fh.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush {fh.name}: {e}")
     
     def log_test_result(self, 
                        result: str,
@@ -228,7 +591,8 @@ class DataLogger:
             logger.warning("No active test session for test result")
             return
         
-        timestamp = datetime.now().isoformat()
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         # Extract data with defaults
         start_pressure = test_data.get('start_pressure', 0.0)
@@ -236,9 +600,14 @@ class DataLogger:
         pressure_drop = test_data.get('pressure_drop', 0.0)
         leak_rate = test_data.get('leak_rate', 0.0)
         
-        # Calculate max pressure from readings
-        pressure_readings = test_data.get('pressure_readings', [])
-        max_pressure = max([reading[1] for reading in pressure_readings]) if pressure_readings else 0.0
+        # Calculate max pressure from the test phase readings: a pressure
+        # array from TestRunner, or (elapsed, pressure) tuples
+        pressure_values = test_data.get('pressure_values')
+        if pressure_values is not None:
+            max_pressure = float(np.max(pressure_values)) if len(pressure_values) else 0.0
+        else:
+            pressure_readings = test_data.get('pressure_readings', [])
+            max_pressure = max(pressure_readings, key=itemgetter(1))[1] if pressure_readings else 0.0
         
         # Get config parameters
         config = self.current_test_data.get('config', {})
@@ -267,11 +636,16 @@ class DataLogger:
         
         # Write to CSV file
         try:
-            with open(self.test_results_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                row_data = [getattr(test_record, field.name) for field in test_record.__dataclass_fields__.values()]
-                writer.writerow(row_data)
-                
+            if now.date() != self._results_day:
+                self._results_fh.close()
+                self._open_results_file(now)
+            self._results_writer.writerow(_TEST_RECORD_ROW(test_record))
+            if self.fsync_results:
+                self._results_fh.flush()
+                os.fsync(self._results_fh.fileno())
+            self._accumulate_daily_stats(timestamp[:10], result, duration, leak_rate,
+                                         start_pressure, max_pressure, pressure_drop)
+            
             logger.info(f"Test result logged: {result} for {self.current_test_id}")
             
         except Exception as e:
@@ -281,6 +655,9 @@ class DataLogger:
         self.log_system_event('INFO', 'TestRunner', 
                              f'Test completed: {result} in {duration:.1f}s, leak rate: {leak_rate:.3f} PSI/s')
         
+        # Push the buffered rows for this test to disk
+        self.flush()
+        
         # Save detailed test data as JSON
         self._save_detailed_test_data(test_record, test_data)
         
@@ -305,7 +682,7 @@ class DataLogger:
             event: Event description
             details: Additional event details
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = self._format_timestamp(time.time())
         
         # Create system event record
         system_event = SystemEvent(
@@ -316,78 +693,200 @@ class DataLogger:
             details=details
         )
         
-        # Store in current test data if test is active
+        # Store in current test data if test is active. The records are flat
+        # and not kept anywhere else, so their attribute dict is used as is
+        # instead of an asdict() deep copy.
         if self.current_test_id:
-            self.current_test_data['events'].append(asdict(system_event))
+            self.current_test_data['events'].append(vars(system_event))
         
-        # Write to CSV file
-        try:
-            with open(self.system_events_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    system_event.timestamp, system_event.level, system_event.component,
-                    system_event.event, system_event.details
-                ])
-        except Exception as e:
-            logger.error(f"Failed to write system event to CSV: {e}")
+        # Hand off to the background writer
+        self._enqueue('E', _SYSTEM_EVENT_ROW(system_event))
     
     def _save_detailed_test_data(self, test_record: TestRecord, test_data: Dict[str, Any]):
-        """Save detailed test data as JSON file."""
+        """Save detailed test data as JSON file plus a pressure reading archive."""
         try:
             # Create detailed test data directory
             detailed_dir = self.log_directory / "detailed_tests"
             detailed_dir.mkdir(exist_ok=True)
             
+            # Pressure readings go to a compressed archive next to the JSON,
+            # together with any sample arrays in the runner's test data
+            archive_file = detailed_dir / f"{self.current_test_id}_pressure.npz"
+            test_arrays = {key: value for key, value in test_data.items()
+                           if isinstance(value, np.ndarray)}
+            self._save_pressure_archive(archive_file, test_arrays)
+            
             # Prepare detailed data
+            current_test_data = dict(self.current_test_data)
+            current_test_data['pressure_readings_file'] = archive_file.name
+            current_test_data['pressure_reading_count'] = self._pres_count
+            current_test_data['pressure_archive_stride'] = self._pres_stride
+            current_test_data['test_data_arrays'] = list(test_arrays)
             detailed_data = {
-                'test_record': asdict(test_record),
-                'test_data': test_data,
-                'current_test_data': self.current_test_data
+                'test_record': vars(test_record),
+                'test_data': {key: value for key, value in test_data.items()
+                              if key not in test_arrays},
+                'current_test_data': current_test_data
             }
             
-            # Save as JSON file
+            # Save as compact JSON file
             json_file = detailed_dir / f"{self.current_test_id}_detailed.json"
             with open(json_file, 'w') as f:
-                json.dump(detailed_data, f, indent=2, default=str)
+                json.dump(detailed_data, f, separators=(',', ':'), default=_json_default)
                 
             logger.info(f"Detailed test data saved: {json_file}")
             
         except Exception as e:
             logger.error(f"Failed to save detailed test data: {e}")
     
+    def _load_daily_stats(self):
+        """
+        Seed today's counters from today's results file and any of today's
+        rows still in the single pre-rotation results file.
+        """
+        try:
+            results_files = [self.test_results_file]
+            legacy_file = self.log_directory / "test_results.csv"
+            if legacy_file.exists():
+                results_files.insert(0, legacy_file)
+            
+            columns = self._read_result_columns(results_files)
+            today = self._results_day.isoformat()
+            today_mask = columns['timestamp'].astype('U10') == today
+            if today_mask.any():
+                self._daily_stats[today] = self._summarize_results(columns, today_mask)
+        except Exception as e:
+            logger.error(f"Failed to load daily statistics: {e}")
+    
+    def _read_result_columns(self, results_files: List[Path]) -> Dict[str, np.ndarray]:
+        """
+        Read the statistics columns of one or more test results files.
+        
+        Args:
+            results_files: Test results CSV files
+            
+        Returns:
+            Dict mapping each RESULT_STAT_COLUMNS name to an array; timestamp
+            and result are strings, the rest float64
+        """
+        values = {name: [] for name in RESULT_STAT_COLUMNS}
+        for results_file in results_files:
+            with open(results_file, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header:
+                    continue
+                getter = itemgetter(*(header.index(name) for name in RESULT_STAT_COLUMNS))
+                
+                # Skip blank lines and rows cut short by an interrupted write
+                width = len(header)
+                rows = (row for row in reader if len(row) >= width)
+                for name, column in zip(RESULT_STAT_COLUMNS, zip(*map(getter, rows))):
+                    values[name].extend(column)
+        
+        # NumPy parses the numeric strings in C
+        return {
+            name: np.array(column, dtype=str if name in ('timestamp', 'result') else np.float64)
+            for name, column in values.items()
+        }
+    
+    def _summarize_results(self, columns: Dict[str, np.ndarray], mask: np.ndarray) -> Dict[str, float]:
+        """
+        Compute result counters for the selected test results.
+        
+        Args:
+            columns: Columns from _read_result_columns()
+            mask: Boolean array selecting the results to include
+            
+        Returns:
+            Dict with the same counters _accumulate_daily_stats() maintains
+        """
+        results = columns['result'][mask]
+        passed = results == 'PASS'
+        failed = results == 'FAIL'
+        completed = passed | failed
+        
+        # Averages and pressure extremes only cover tests that ran to completion
+        def completed_values(name):
+            return columns[name][mask][completed]
+        
+        any_completed = bool(completed.any())
+        return {
+            'count': len(results),
+            'pass': int(passed.sum()),
+            'fail': int(failed.sum()),
+            'error': int((results == 'ERROR').sum()),
+            'completed': int(completed.sum()),
+            'sum_duration': float(completed_values('duration').sum()),
+            'sum_leak_rate': float(completed_values('leak_rate').sum()),
+            'sum_pressure_drop': float(completed_values('pressure_drop').sum()),
+            'min_pressure': float(completed_values('start_pressure').min()) if any_completed else float('inf'),
+            'max_pressure': float(completed_values('max_pressure_reached').max()) if any_completed else float('-inf')
+        }
+    
+    def _accumulate_daily_stats(self, date: str, result: str, duration: float, leak_rate: float,
+                                start_pressure: float, max_pressure: float, pressure_drop: float):
+        """
+        Add one test result to the counters for its day.
+        
+        Args:
+            date: Test date (YYYY-MM-DD)
+            result: Test result (PASS, FAIL, ERROR)
+            duration: Test duration in seconds
+            leak_rate: Leak rate in PSI/s
+            start_pressure: Pressure at start of test phase
+            max_pressure: Maximum pressure reached
+            pressure_drop: Pressure drop during test phase
+        """
+        stats = self._daily_stats.get(date)
+        if stats is None:
+            stats = self._daily_stats[date] = {
+                'count': 0, 'pass': 0, 'fail': 0, 'error': 0, 'completed': 0,
+                'sum_duration': 0.0, 'sum_leak_rate': 0.0, 'sum_pressure_drop': 0.0,
+                'min_pressure': float('inf'), 'max_pressure': float('-inf')
+            }
+        
+        stats['count'] += 1
+        if result == 'PASS':
+            stats['pass'] += 1
+        elif result == 'FAIL':
+            stats['fail'] += 1
+        elif result == 'ERROR':
+            stats['error'] += 1
+        
+        # Averages and pressure extremes only cover tests that ran to completion
+        if result in ('PASS', 'FAIL'):
+            stats['completed'] += 1
+            stats['sum_duration'] += duration
+            stats['sum_leak_rate'] += leak_rate
+            stats['sum_pressure_drop'] += pressure_drop
+            stats['min_pressure'] = min(stats['min_pressure'], start_pressure)
+            stats['max_pressure'] = max(stats['max_pressure'], max_pressure)
+    
     def _update_daily_summary(self):
         """Update daily summary statistics."""
         try:
             today = datetime.now().strftime('%Y-%m-%d')
             
-            # Read existing test results for today
-            today_tests = []
-            if self.test_results_file.exists():
-                with open(self.test_results_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        test_date = row['timestamp'][:10]  # Extract date part
-                        if test_date == today:
-                            today_tests.append(row)
-            
-            if not today_tests:
+            stats = self._daily_stats.get(today)
+            if not stats:
                 return
             
             # Calculate statistics
-            total_tests = len(today_tests)
-            pass_count = sum(1 for test in today_tests if test['result'] == 'PASS')
-            fail_count = sum(1 for test in today_tests if test['result'] == 'FAIL')
-            error_count = sum(1 for test in today_tests if test['result'] == 'ERROR')
+            total_tests = stats['count']
+            pass_count = stats['pass']
+            fail_count = stats['fail']
+            error_count = stats['error']
             pass_rate = (pass_count / total_tests * 100) if total_tests > 0 else 0
             
             # Calculate averages (only for successful tests)
-            successful_tests = [test for test in today_tests if test['result'] in ['PASS', 'FAIL']]
-            if successful_tests:
-                avg_duration = sum(float(test['duration']) for test in successful_tests) / len(successful_tests)
-                avg_leak_rate = sum(float(test['leak_rate']) for test in successful_tests) / len(successful_tests)
-                min_pressure = min(float(test['start_pressure']) for test in successful_tests)
-                max_pressure = max(float(test['max_pressure_reached']) for test in successful_tests)
-                avg_pressure_drop = sum(float(test['pressure_drop']) for test in successful_tests) / len(successful_tests)
+            completed = stats['completed']
+            if completed:
+                avg_duration = stats['sum_duration'] / completed
+                avg_leak_rate = stats['sum_leak_rate'] / completed
+                min_pressure = stats['min_pressure']
+                max_pressure = stats['max_pressure']
+                avg_pressure_drop = stats['sum_pressure_drop'] / completed
             else:
                 avg_duration = avg_leak_rate = min_pressure = max_pressure = avg_pressure_drop = 0.0
             
@@ -399,7 +898,8 @@ class DataLogger:
             ]
             
             # Read existing summary and update or append
-            existing_summaries = []
+            self.daily_summary_file = self._dated_file("daily_summary", datetime.now())
+            existing_summaries = [DAILY_SUMMARY_HEADER]
             if self.daily_summary_file.exists():
                 with open(self.daily_summary_file, 'r') as f:
                     reader = csv.reader(f)
@@ -437,39 +937,30 @@ class DataLogger:
             Dict containing test statistics
         """
         try:
-            from datetime import timedelta
-            
             # Calculate date range
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            # Read test results
-            test_results = []
-            if self.test_results_file.exists():
-                with open(self.test_results_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        test_date = datetime.fromisoformat(row['timestamp'].replace('Z', '+00:00')).replace(tzinfo=None)
-                        if start_date <= test_date <= end_date:
-                            test_results.append(row)
+            # Aggregate the results in range column-wise; ISO timestamps
+            # compare correctly as strings
+            columns = self._read_result_columns(self._results_files_between(start_date, end_date))
+            timestamps = columns['timestamp']
+            in_range = (timestamps >= start_date.isoformat()) & (timestamps <= end_date.isoformat())
+            summary = self._summarize_results(columns, in_range)
             
-            # Calculate statistics
-            total_tests = len(test_results)
+            total_tests = summary['count']
             if total_tests == 0:
                 return {'error': 'No test data available for the specified period'}
             
-            pass_count = sum(1 for test in test_results if test['result'] == 'PASS')
-            fail_count = sum(1 for test in test_results if test['result'] == 'FAIL')
-            error_count = sum(1 for test in test_results if test['result'] == 'ERROR')
-            
-            successful_tests = [test for test in test_results if test['result'] in ['PASS', 'FAIL']]
+            pass_count = summary['pass']
+            completed = summary['completed']
             
             stats = {
                 'period_days': days,
                 'total_tests': total_tests,
                 'pass_count': pass_count,
-                'fail_count': fail_count,
-                'error_count': error_count,
+                'fail_count': summary['fail'],
+                'error_count': summary['error'],
                 'pass_rate': (pass_count / total_tests * 100) if total_tests > 0 else 0,
                 'avg_duration': 0,
                 'avg_leak_rate': 0,
@@ -478,13 +969,13 @@ class DataLogger:
                 'avg_pressure_drop': 0
             }
             
-            if successful_tests:
+            if completed:
                 stats.update({
-                    'avg_duration': sum(float(test['duration']) for test in successful_tests) / len(successful_tests),
-                    'avg_leak_rate': sum(float(test['leak_rate']) for test in successful_tests) / len(successful_tests),
-                    'min_pressure': min(float(test['start_pressure']) for test in successful_tests),
-                    'max_pressure': max(float(test['max_pressure_reached']) for test in successful_tests),
-                    'avg_pressure_drop': sum(float(test['pressure_drop']) for test in successful_tests) / len(successful_tests)
+                    'avg_duration': summary['sum_duration'] / completed,
+                    'avg_leak_rate': summary['sum_leak_rate'] / completed,
+                    'min_pressure': summary['min_pressure'],
+                    'max_pressure': summary['max_pressure'],
+                    'avg_pressure_drop': summary['sum_pressure_drop'] / completed
                 })
             
             return stats
@@ -493,14 +984,113 @@ class DataLogger:
             logger.error(f"Failed to calculate test statistics: {e}")
             return {'error': str(e)}
     
+    def _results_files_between(self, start_date: datetime, end_date: datetime) -> List[Path]:
+        """
+        Get the existing test results files that can hold results in a date range.
+        
+        Args:
+            start_date: Start of the range
+            end_date: End of the range
+            
+        Returns:
+            List of file paths, including the single pre-rotation results file
+        """
+        files = []
+        legacy_file = self.log_directory / "test_results.csv"
+        if legacy_file.exists():
+            files.append(legacy_file)
+        
+        day = start_date
+        while day.date() <= end_date.date():
+            path = self._dated_file("test_results", day)
+            if path.exists():
+                files.append(path)
+            day += timedelta(days=1)
+        
+        return files
+    
+    def flush(self):
+        """Write queued and buffered CSV rows to disk."""
+        if self._closed:
+            return
+        
+        # Wait for the background writer to write and flush everything queued
+        self._enqueue('FLUSH', None)
+        self._queue.join()
+        
+        try:
+            self._results_fh.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush {self._results_fh.name}: {e}")
+    
     def close(self):
         """Clean up data logger resources."""
+        if self._closed:
+            return
+        
         logger.info("Closing data logger")
         
         # Log final system event if test is active
         if self.current_test_id:
             self.log_system_event('WARNING', 'DataLogger', 
                                 f'Test session {self.current_test_id} terminated during logging cleanup')
+        
+        # Stop the background writer once it has written everything queued
+        self._enqueue('STOP', None)
+        self._writer_thread.join()
+        self._closed = True
+        
+        if self._dropped_rows:
+            logger.warning(f"Data logger dropped {self._dropped_rows} row(s) while the queue was full")
+        
+        # Flush and close the CSV files
+        for fh in (self._pressure_fh, self._events_fh, self._results_fh):
+            fh.close()
+        
+        atexit.unregister(self.close)
+
+def _json_default(obj: Any) -> Any:
+    """Serialize NumPy arrays and scalars as JSON values, anything else as str."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    return str(obj)
+
+def _xor_encode(values: np.ndarray) -> np.ndarray:
+    """XOR the bit pattern of each float64 value with that of its predecessor."""
+    bits = values.view(np.uint64)
+    encoded = bits.copy()
+    encoded[1:] ^= bits[:-1]
+    return encoded
+
+def _xor_decode(encoded: np.ndarray) -> np.ndarray:
+    """Reverse _xor_encode()."""
+    return np.bitwise_xor.accumulate(encoded).view(np.float64)
+
+def load_pressure_archive(archive_file) -> Dict[str, np.ndarray]:
+    """
+    Load a pressure reading archive written by DataLogger.
+    
+    Args:
+        archive_file: Path to a *_pressure.npz file in detailed_tests
+        
+    Returns:
+        Dict with 'timestamp' (epoch seconds), 'elapsed_time', 'pressure_psi',
+        'raw_current_ma' and 'phase' arrays, plus any 'test_' arrays saved
+        from the test data
+    """
+    with np.load(archive_file) as archive:
+        time_us = np.cumsum(np.cumsum(archive['time_us_dod']))
+        phases = archive['phases']
+        phase_idx = archive['phase_idx']
+        result = {
+            'timestamp': time_us / 1e6,
+            'elapsed_time': _xor_decode(archive['elapsed_time_xor']),
+            'pressure_psi': _xor_decode(archive['pressure_psi_xor']),
+            'raw_current_ma': _xor_decode(archive['raw_current_ma_xor']),
+            'phase': phases[phase_idx] if len(phases) else np.array([], dtype=str)
+        }
+        result.update({name: archive[name] for name in archive.files if name.startswith('test_')})
+        return result
 
 def main():
     """Test the data logger."""
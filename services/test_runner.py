@@ -7,11 +7,15 @@ Controls all hardware modules and manages the test state machine.
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, Callable
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Tuple
+from dataclasses import dataclass, asdict
+
+import numpy as np
 
 # Handle imports for both module use and standalone testing
 try:
@@ -41,6 +45,80 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Logging intervals of the stabilize and test phases (nanoseconds)
+STABILIZE_LOG_INTERVAL_NS = 2_000_000_000
+TEST_SAMPLE_INTERVAL_NS = 1_000_000_000
+
+# Test-phase acquisition: a burst of ADC conversions every batch interval.
+# The burst is sized from the ADC sample rate to fill this fraction of the
+# interval, leaving a margin so a burst doesn't overrun its slot.
+TEST_BATCH_INTERVAL_NS = 100_000_000
+TEST_BATCH_FILL = 0.75
+
+# Pressure logging interval while a timed hardware action runs (seconds)
+ACTUATION_SAMPLE_INTERVAL_S = 1.0
+
+# ADC samples averaged per pressure reading: a single conversion inside
+# periodic sampling loops, averaged readings at phase checkpoints
+LOOP_SAMPLES = 1
+CHECKPOINT_SAMPLES = 3
+
+# Safety-limit polling interval between logged samples (nanoseconds)
+SAFETY_POLL_INTERVAL_NS = 100_000_000
+
+# Early pass/fail decision: once at least EARLY_DECISION_MIN_FRACTION of
+# test_duration has passed (and EARLY_DECISION_MIN_BATCHES bursts were read),
+# stop when the leak rate fitted to the burst means is this many standard
+# errors away from the limit. Samples within a burst are strongly
+# correlated, so the burst means are the independent points for the error.
+EARLY_DECISION_MIN_FRACTION = 0.25
+EARLY_DECISION_MIN_BATCHES = 10
+EARLY_DECISION_SIGMAS = 3.0
+
+def _sleep_until(deadline_ns: int):
+    """
+    Sleep until a time.monotonic_ns() deadline.
+    
+    Sleeping to absolute deadlines keeps periodic sampling on a fixed grid;
+    the time spent reading and logging does not accumulate as drift.
+    
+    Args:
+        deadline_ns: Deadline on the time.monotonic_ns() clock
+    """
+    remaining_ns = deadline_ns - time.monotonic_ns()
+    if remaining_ns > 0:
+        time.sleep(remaining_ns / 1e9)
+
+def _fit_leak_rate(times: np.ndarray, pressures: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Fit a line to pressure readings and return the leak rate.
+    
+    The leak rate is the negated least-squares slope over all readings,
+    which is far less sensitive to noise on the two end readings than
+    (start - end) / duration.
+    
+    Args:
+        times: Reading times in seconds
+        pressures: Pressures in PSI
+        
+    Returns:
+        Tuple of (leak rate in PSI/s, its standard error, RMS residual
+        pressure noise in PSI)
+    """
+    t_centered = times - times.mean()
+    t_variance = np.dot(t_centered, t_centered)
+    if t_variance <= 0:
+        return 0.0, 0.0, 0.0
+    
+    slope = np.dot(t_centered, pressures) / t_variance
+    
+    # Residual scatter around the fit is the measurement noise; the
+    # standard error of the slope follows from it
+    residuals = pressures - pressures.mean() - slope * t_centered
+    dof = len(pressures) - 2
+    pressure_noise = float(np.sqrt(np.dot(residuals, residuals) / dof)) if dof > 0 else 0.0
+    return float(-slope), pressure_noise / float(np.sqrt(t_variance)), pressure_noise
+
 class TestPhase(Enum):
     """Enumeration of test phases."""
     READY = "Ready"
@@ -62,9 +140,14 @@ class TestResult(Enum):
     FAIL = "FAIL"
     ERROR = "ERROR"
 
-@dataclass
+@dataclass(frozen=True)
 class TestConfig:
-    """Test configuration parameters."""
+    """
+    Test configuration parameters.
+    
+    Frozen so a running test and its logged configuration can't change under
+    each other; use dataclasses.replace() to derive a modified config.
+    """
     # Timing parameters (seconds)
     cylinder_extend_time: float = 3.0
     fill_time: float = 5.0
@@ -81,6 +164,10 @@ class TestConfig:
     # Safety parameters
     max_pressure: float = 15.0
     pressure_timeout: float = 60.0
+    
+    # End the test phase early once the leak rate is clearly above or below
+    # max_leak_rate (see EARLY_DECISION_SIGMAS)
+    early_decision: bool = False
 
     def __str__(self):
         return f"TestConfig(target_pressure={self.target_fill_pressure}, max_leak_rate={self.max_leak_rate})"
@@ -125,12 +212,17 @@ class TestRunner:
             enable_logging: Enable data logging (default True)
         """
         self.config = config or create_test_config_from_file()
+        self._config_dict = None
+        self._config_dict_source = None
         self.phase_callback = phase_callback
         self.enable_logging = enable_logging
         
         # Initialize hardware controllers
         self._initialize_hardware()
         
+        # Runs timed hardware actions so pressure can be sampled meanwhile
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TestRunnerHW")
+        
         # Initialize data logger
         self.data_logger = None
         if self.enable_logging and DataLogger is not None:
@@ -146,16 +238,38 @@ class TestRunner:
         
         # Test state
         self.current_phase = TestPhase.READY
+        self._phase_name = self.current_phase.value
+        self._log_info = logger.isEnabledFor(logging.INFO)
         self.test_result = TestResult.NONE
         self.test_data = {}
         self.is_testing = False
         self.start_time = None
+        self._start_ns = 0
+        # True while pressure readings go to the data logger: set once the
+        # logging session has started and cleared when the test ends
+        self._log_live = False
         self.test_id = None
         
         logger.info("TestRunner initialized")
         logger.info(f"Test config: {self.config}")
         logger.info(f"Data logging: {'enabled' if self.enable_logging else 'disabled'}")
     
+    def _get_config_dict(self) -> Dict[str, Any]:
+        """
+        Get the test configuration as a dict for logging.
+        
+        The dict is built once and reused for every test until a different
+        TestConfig is assigned to self.config. TestConfig is frozen, so the
+        config can only change by assigning a new object.
+        
+        Returns:
+            Dict of all TestConfig fields
+        """
+        if self._config_dict_source is not self.config:
+            self._config_dict = asdict(self.config)
+            self._config_dict_source = self.config
+        return self._config_dict
+    
     def _initialize_hardware(self):
         """Initialize all hardware controllers."""
         try:
@@ -174,6 +288,19 @@ class TestRunner:
                 max_pressure_psi=15.0
             )
             
+            # Raw loop current reader for the pressure log, or None if the
+            # ADC reader does not provide one
+            adc_reader = getattr(self.pressure_calibration, 'adc_reader', None)
+            self._read_current_ma = getattr(adc_reader, 'read_current_ma', None)
+            
+            # Convert continuously so test-phase bursts read the conversion
+            # register, and size each burst to fit its batch interval
+            start_conversion = getattr(adc_reader, 'start_conversion', None)
+            if start_conversion is not None:
+                start_conversion()
+            sample_rate = getattr(adc_reader, 'sample_rate', 860)
+            self._batch_samples = max(1, int(sample_rate * TEST_BATCH_INTERVAL_NS / 1e9 * TEST_BATCH_FILL))
+            
             logger.info("✓ All hardware controllers initialized")
             
         except Exception as e:
@@ -187,9 +314,10 @@ class TestRunner:
         Args:
             phase: New test phase
         """
-        if self.current_phase != phase:
+        if self.current_phase is not phase:
             old_phase = self.current_phase
             self.current_phase = phase
+            self._phase_name = phase.value
             
             logger.info(f"Phase transition: {old_phase.value} → {phase.value}")
             
@@ -200,28 +328,76 @@ class TestRunner:
                 except Exception as e:
                     logger.error(f"Phase callback error: {e}")
     
-    def _log_pressure(self, context: str = ""):
+    def _log_pressure(self, context: str = "", num_samples: int = CHECKPOINT_SAMPLES) -> float:
         """Log current pressure reading."""
-        try:
-            pressure = self.pressure_calibration.read_pressure_psi(num_samples=3)
-            logger.info(f"Pressure reading{' (' + context + ')' if context else ''}: {pressure:.2f} PSI")
+        pressure = self._read_and_log_pressure(context, num_samples)
+        return pressure if pressure is not None else 0.0
+    
+    def _sample_and_check(self, context: str, num_samples: int = CHECKPOINT_SAMPLES) -> Tuple[float, bool]:
+        """
+        Take one pressure reading, log it and check it against the safety limit.
+        
+        Args:
+            context: Context label for the pressure log
+            num_samples: Number of ADC samples to average
             
-            # Log to data logger if enabled and test is active
-            if self.enable_logging and self.data_logger and self.is_testing and self.start_time:
-                elapsed_time = (datetime.now() - self.start_time).total_seconds()
-                phase_name = self.current_phase.value if self.current_phase else "Unknown"
-                
-                # Get raw current reading if available
-                raw_current = 0.0
-                try:
-                    raw_current = self.pressure_calibration.adc_reader.read_current_ma()
-                except:
-                    pass
-                
-                self.data_logger.log_pressure_reading(
-                    phase_name, elapsed_time, pressure, raw_current
-                )
+        Returns:
+            Tuple of (pressure in PSI, True if within safety limits). A failed
+            read returns (0.0, False).
+        """
+        pressure = self._read_and_log_pressure(context, num_samples)
+        if pressure is None:
+            return 0.0, False
+        
+        if pressure > self.config.max_pressure:
+            logger.error(f"Pressure safety limit exceeded: {pressure:.2f} > {self.config.max_pressure} PSI")
+            return pressure, False
+        
+        return pressure, True
+    
+    def _watch_until(self, deadline_ns: int) -> bool:
+        """
+        Wait until a deadline while polling pressure against the safety limit.
+        
+        Bounds the over-pressure reaction time to SAFETY_POLL_INTERVAL_NS
+        instead of the phase's logging interval. Readings taken here are
+        only checked, not logged.
+        
+        Args:
+            deadline_ns: Deadline on the time.monotonic_ns() clock
+            
+        Returns:
+            bool: True if the deadline was reached within limits, False on a breach
+        """
+        read_pressure_psi = self.pressure_calibration.read_pressure_psi
+        max_pressure = self.config.max_pressure
+        
+        next_poll = time.monotonic_ns() + SAFETY_POLL_INTERVAL_NS
+        while next_poll < deadline_ns:
+            _sleep_until(next_poll)
+            pressure = read_pressure_psi(num_samples=LOOP_SAMPLES)
+            if pressure > max_pressure:
+                logger.error(f"Pressure safety limit exceeded: {pressure:.2f} > {max_pressure} PSI")
+                return False
+            next_poll = time.monotonic_ns() + SAFETY_POLL_INTERVAL_NS
+        
+        _sleep_until(deadline_ns)
+        return True
+    
+    def _read_and_log_pressure(self, context: str = "", num_samples: int = CHECKPOINT_SAMPLES) -> Optional[float]:
+        """
+        Read the pressure and log it to the console and the data logger.
+        
+        Args:
+            context: Context label for the pressure log
+            num_samples: Number of ADC samples to average
             
+        Returns:
+            Optional[float]: Pressure in PSI, or None if the read failed
+        """
+        try:
+            pressure = self.pressure_calibration.read_pressure_psi(num_samples=num_samples)
+            self._log_reading(context, pressure)
             return pressure
         except Exception as e:
             logger.error(f"Failed to read pressure: {e}")
@@ -231,27 +407,82 @@ class TestRunner:
                 self.data_logger.log_system_event('ERROR', 'PressureTransducer', 
                                                 'Pressure reading failed', str(e))
             
-            return 0.0
+            return None
     
-    def _check_safety_limits(self) -> bool:
+    def _log_reading(self, context: str, pressure: float):
         """
-        Check if system is within safety limits.
+        Log a pressure reading to the console and the data logger.
         
-        Returns:
-            bool: True if safe, False if safety limit exceeded
+        Args:
+            context: Context label for the pressure log
+            pressure: Pressure in PSI
         """
-        try:
-            pressure = self.pressure_calibration.read_pressure_psi()
+        if self._log_info:
+            if context:
+                logger.info("Pressure reading (%s): %.2f PSI", context, pressure)
+            else:
+                logger.info("Pressure reading: %.2f PSI", pressure)
+        
+        # Log to data logger if enabled and test is active
+        if self._log_live:
+            elapsed_time = (time.monotonic_ns() - self._start_ns) / 1e9
             
-            if pressure > self.config.max_pressure:
-                logger.error(f"Pressure safety limit exceeded: {pressure:.2f} > {self.config.max_pressure} PSI")
-                return False
-                
-            return True
+            # Get raw current reading if available
+            raw_current = 0.0
+            if self._read_current_ma is not None:
+                try:
+                    raw_current = self._read_current_ma()
+                except Exception as e:
+                    # Stop probing a reader that fails rather than paying
+                    # for the failure on every sample
+                    logger.warning(f"Raw current reading unavailable: {e}")
+                    self._read_current_ma = None
             
-        except Exception as e:
-            logger.error(f"Safety check failed: {e}")
-            return False
+            self.data_logger.log_pressure_reading(
+                self._phase_name, elapsed_time, pressure, raw_current
+            )
+    
+    def _run_while_sampling(self, context: str, action: Callable, **kwargs) -> Any:
+        """
+        Run a blocking, timed hardware action while logging pressure.
+        
+        The action runs on the hardware executor thread; this thread logs a
+        pressure reading every ACTUATION_SAMPLE_INTERVAL_S until it finishes.
+        Only this thread reads the ADC, so no bus locking is needed.
+        
+        Args:
+            context: Context label for the pressure log
+            action: Hardware method to run (e.g. self.solenoid_valves.fill)
+            **kwargs: Arguments for the action
+            
+        Returns:
+            The action's return value; exceptions are re-raised
+        """
+        future = self._executor.submit(action, **kwargs)
+        while True:
+            try:
+                return future.result(timeout=ACTUATION_SAMPLE_INTERVAL_S)
+            except FutureTimeoutError:
+                self._log_pressure(context, num_samples=LOOP_SAMPLES)
+    
+    def _run_phase(self, run_phase: Callable[[], bool]) -> bool:
+        """
+        Run one phase method and record it in test_data["phases"].
+        
+        Args:
+            run_phase: Phase method, e.g. self._phase_fill_dut
+            
+        Returns:
+            bool: The phase method's result
+        """
+        phase_start = time.monotonic_ns()
+        success = run_phase()
+        self.test_data["phases"].append({
+            "phase": self._phase_name,
+            "duration": (time.monotonic_ns() - phase_start) / 1e9,
+            "success": bool(success)
+        })
+        return success
     
     def run_test(self) -> TestResult:
         """
@@ -264,51 +495,48 @@ class TestRunner:
         logger.info("STARTING LEAK TEST")
         logger.info("=" * 50)
         
+        # Per-sample log lines are only formatted when INFO is enabled;
+        # re-check the level once per test rather than once per sample
+        self._log_info = logger.isEnabledFor(logging.INFO)
+        
         self.is_testing = True
+        # Wall-clock start for records; all elapsed times use the monotonic clock
         self.start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()
         self.test_result = TestResult.NONE
         self.test_data = {
             "start_time": self.start_time,
-            "pressure_readings": [],
+            "pressure_times": np.empty(0),
+            "pressure_values": np.empty(0),
             "phases": []
         }
         
         # Start data logging session
         if self.enable_logging and self.data_logger:
             try:
-                # Convert config to dict for logging
-                config_dict = {
-                    'target_fill_pressure': self.config.target_fill_pressure,
-                    'max_leak_rate': self.config.max_leak_rate,
-                    'cylinder_extend_time': self.config.cylinder_extend_time,
-                    'fill_time': self.config.fill_time,
-                    'stabilize_time': self.config.stabilize_time,
-                    'test_duration': self.config.test_duration,
-                    'exhaust_time': self.config.exhaust_time,
-                    'cylinder_retract_time': self.config.cylinder_retract_time,
-                    'max_pressure': self.config.max_pressure,
-                    'pressure_tolerance': self.config.pressure_tolerance,
-                    'pressure_timeout': self.config.pressure_timeout
-                }
-                self.test_id = self.data_logger.start_test_session(config_dict)
+                self.test_id = self.data_logger.start_test_session(self._get_config_dict())
+                self._log_live = True
                 logger.info(f"Data logging session started: {self.test_id}")
             except Exception as e:
                 logger.error(f"Failed to start data logging session: {e}")
         
         try:
-            # Execute test sequence
-            if self._phase_extend_cylinders():
-                if self._phase_fill_dut():
-                    if self._phase_stabilize():
-                        if self._phase_isolate():
-                            if self._phase_test():
-                                if self._phase_evaluate():
-                                    # Test completed successfully
-                                    pass
+            # Execute test sequence, stopping at the first failed phase
+            test_sequence = (
+                self._phase_extend_cylinders,
+                self._phase_fill_dut,
+                self._phase_stabilize,
+                self._phase_isolate,
+                self._phase_test,
+                self._phase_evaluate
+            )
+            for run_phase in test_sequence:
+                if not self._run_phase(run_phase):
+                    break
             
             # Always run cleanup phases
-            self._phase_exhaust()
-            self._phase_retract_cylinders()
+            self._run_phase(self._phase_exhaust)
+            self._run_phase(self._phase_retract_cylinders)
             
             # Set final phase
             if self.test_result == TestResult.NONE:
@@ -331,8 +559,9 @@ class TestRunner:
             
         finally:
             self.is_testing = False
+            self._log_live = False
             end_time = datetime.now()
-            duration = (end_time - self.start_time).total_seconds()
+            duration = (time.monotonic_ns() - self._start_ns) / 1e9
             
             self.test_data["end_time"] = end_time
             self.test_data["duration"] = duration
@@ -371,7 +600,8 @@ class TestRunner:
                 self.data_logger.log_system_event('INFO', 'Cylinders', 
                                                 f'Starting cylinder extension for {self.config.cylinder_extend_time}s')
             
-            success = self.cylinders.extend(duration=self.config.cylinder_extend_time)
+            success = self._run_while_sampling("extending", self.cylinders.extend,
+                                               duration=self.config.cylinder_extend_time)
             
             if success:
                 logger.info("✓ Cylinders extended successfully")
@@ -406,7 +636,8 @@ class TestRunner:
                                                 f'Opening fill valve for {self.config.fill_time}s')
             
             # Open fill valve
-            success = self.solenoid_valves.fill(duration=self.config.fill_time)
+            success = self._run_while_sampling("filling", self.solenoid_valves.fill,
+                                               duration=self.config.fill_time)
             
             if success:
                 # Check pressure after filling
@@ -447,14 +678,19 @@ class TestRunner:
             logger.info(f"Stabilizing pressure for {self.config.stabilize_time}s")
             
             # Log pressure every few seconds during stabilization
-            stabilize_start = time.time()
-            while (time.time() - stabilize_start) < self.config.stabilize_time:
-                if not self._check_safety_limits():
+            stabilize_start = time.monotonic_ns()
+            stabilize_end = stabilize_start + int(self.config.stabilize_time * 1e9)
+            next_sample = stabilize_start
+            while next_sample < stabilize_end:
+                _, safe = self._sample_and_check("stabilizing", num_samples=LOOP_SAMPLES)
+                if not safe:
                     self.test_result = TestResult.ERROR
                     return False
                 
-                self._log_pressure("stabilizing")
-                time.sleep(2.0)  # Log every 2 seconds
+                next_sample += STABILIZE_LOG_INTERVAL_NS
+                if not self._watch_until(min(next_sample, stabilize_end)):
+                    self.test_result = TestResult.ERROR
+                    return False
             
             logger.info("✓ Pressure stabilization complete")
             return True
@@ -497,26 +733,101 @@ class TestRunner:
             
             # Record initial pressure
             start_pressure = self._log_pressure("test start")
-            test_start_time = time.time()
+            test_start = time.monotonic_ns()
+            test_end = test_start + int(self.config.test_duration * 1e9)
+            
+            # Preallocated sample columns: the start reading plus one burst
+            # per scheduled batch
+            batches = 1 + (test_end - test_start) // TEST_BATCH_INTERVAL_NS
+            batch_samples = self._batch_samples
+            capacity = 1 + batches * batch_samples
+            times = np.empty(capacity, dtype=np.float64)
+            pressures = np.empty(capacity, dtype=np.float64)
+            times[0] = 0.0
+            pressures[0] = start_pressure
+            count = 1
             
-            pressure_readings = [(0.0, start_pressure)]
+            # One mean per burst, the independent points for the leak rate's
+            # standard error
+            batch_times = np.empty(batches, dtype=np.float64)
+            batch_means = np.empty(batches, dtype=np.float64)
+            batch_count = 0
             
-            # Record pressure throughout test
-            while (time.time() - test_start_time) < self.config.test_duration:
-                if not self._check_safety_limits():
+            max_pressure = self.config.max_pressure
+            max_leak_rate = self.config.max_leak_rate
+            early_decision_at = None
+            if self.config.early_decision:
+                early_decision_at = test_start + int(self.config.test_duration * EARLY_DECISION_MIN_FRACTION * 1e9)
+            read_pressures_psi = self.pressure_calibration.read_pressures_psi
+            self.test_data["early_decision"] = False
+            
+            # Read a burst of samples every batch interval on a fixed schedule
+            # relative to the test start. Every sample is checked against the
+            # safety limit; one burst average per second is logged.
+            next_batch = test_start
+            next_log = test_start
+            while next_batch < test_end:
+                batch_start = time.monotonic_ns()
+                if batch_start >= test_end:
+                    # Slow reads fell behind the schedule; don't overrun the test
+                    break
+                batch = read_pressures_psi(batch_samples)
+                batch_end = time.monotonic_ns()
+                
+                # A short burst means an ADC read failed; the test data is
+                # incomplete, so the result is an error rather than a verdict
+                if len(batch) < batch_samples:
+                    logger.error(f"Pressure burst read failed: {len(batch)} of {batch_samples} samples")
+                    if self.enable_logging and self.data_logger:
+                        self.data_logger.log_system_event('ERROR', 'PressureTransducer',
+                                                        'Pressure burst read failed',
+                                                        f"{len(batch)} of {batch_samples} samples")
                     self.test_result = TestResult.ERROR
                     return False
                 
-                elapsed = time.time() - test_start_time
-                pressure = self.pressure_calibration.read_pressure_psi()
-                pressure_readings.append((elapsed, pressure))
+                # Conversions are evenly paced, so spread the batch's sample
+                # times across the interval it took to read
+                end = count + len(batch)
+                pressures[count:end] = batch
+                times[count:end] = np.linspace(batch_start - test_start,
+                                               batch_end - test_start, len(batch)) / 1e9
+                count = end
+                
+                batch_times[batch_count] = (batch_start + batch_end - 2 * test_start) / 2e9
+                batch_means[batch_count] = batch.mean()
+                batch_count += 1
+                
+                peak = float(batch.max())
+                if peak > max_pressure:
+                    logger.error(f"Pressure safety limit exceeded: {peak:.2f} > {max_pressure} PSI")
+                    self.test_result = TestResult.ERROR
+                    return False
                 
-                logger.info(f"Test pressure [{elapsed:.1f}s]: {pressure:.2f} PSI")
+                if batch_start >= next_log:
+                    elapsed = (batch_start - test_start) / 1e9
+                    context = f"test {elapsed:.1f}s" if self._log_info else "test"
+                    self._log_reading(context, float(batch_means[batch_count - 1]))
+                    next_log += TEST_SAMPLE_INTERVAL_NS
+                    
+                    # Stop as soon as the result can no longer change
+                    if (early_decision_at is not None and batch_start >= early_decision_at
+                            and batch_count >= EARLY_DECISION_MIN_BATCHES):
+                        leak_rate, leak_rate_sigma, _ = _fit_leak_rate(batch_times[:batch_count],
+                                                                       batch_means[:batch_count])
+                        if abs(leak_rate - max_leak_rate) > EARLY_DECISION_SIGMAS * leak_rate_sigma:
+                            logger.info(f"Early decision after {elapsed:.1f}s: leak rate "
+                                        f"{leak_rate:.4f} ± {leak_rate_sigma:.4f} PSI/s")
+                            self.test_data["early_decision"] = True
+                            break
                 
-                time.sleep(1.0)  # Record every second
+                next_batch += TEST_BATCH_INTERVAL_NS
+                _sleep_until(min(next_batch, test_end))
             
             # Store pressure data for evaluation
-            self.test_data["pressure_readings"] = pressure_readings
+            self.test_data["pressure_times"] = times[:count]
+            self.test_data["pressure_values"] = pressures[:count]
+            self.test_data["batch_times"] = batch_times[:batch_count]
+            self.test_data["batch_means"] = batch_means[:batch_count]
             
             logger.info("✓ Pressure recording complete")
             return True
@@ -533,25 +844,31 @@ class TestRunner:
         try:
             logger.info("Evaluating test results")
             
-            pressure_readings = self.test_data.get("pressure_readings", [])
+            times = self.test_data.get("pressure_times", np.empty(0))
+            pressures = self.test_data.get("pressure_values", np.empty(0))
             
-            if len(pressure_readings) < 2:
+            if len(pressures) < 2:
                 logger.error("Insufficient pressure data for evaluation")
                 self.test_result = TestResult.ERROR
                 return False
             
-            # Calculate pressure drop rate
-            start_pressure = pressure_readings[0][1]
-            end_pressure = pressure_readings[-1][1]
-            duration = pressure_readings[-1][0]
-            
+            start_pressure = float(pressures[0])
+            end_pressure = float(pressures[-1])
             pressure_drop = start_pressure - end_pressure
-            leak_rate = pressure_drop / duration if duration > 0 else 0
+            
+            leak_rate, leak_rate_sigma, pressure_noise = _fit_leak_rate(times, pressures)
+            
+            # The per-sample standard error treats correlated samples within
+            # a burst as independent; take it from the burst means instead
+            batch_means = self.test_data.get("batch_means", np.empty(0))
+            if len(batch_means) > 2:
+                _, leak_rate_sigma, _ = _fit_leak_rate(self.test_data["batch_times"], batch_means)
             
             logger.info(f"Start pressure: {start_pressure:.2f} PSI")
             logger.info(f"End pressure: {end_pressure:.2f} PSI")
             logger.info(f"Pressure drop: {pressure_drop:.2f} PSI")
-            logger.info(f"Leak rate: {leak_rate:.3f} PSI/s")
+            logger.info(f"Leak rate: {leak_rate:.3f} ± {leak_rate_sigma:.3f} PSI/s")
+            logger.info(f"Pressure noise: {pressure_noise:.4f} PSI RMS over {len(pressures)} readings")
             logger.info(f"Max allowed leak rate: {self.config.max_leak_rate:.3f} PSI/s")
             
             # Store evaluation data
@@ -559,6 +876,8 @@ class TestRunner:
             self.test_data["end_pressure"] = end_pressure
             self.test_data["pressure_drop"] = pressure_drop
             self.test_data["leak_rate"] = leak_rate
+            self.test_data["leak_rate_sigma"] = leak_rate_sigma
+            self.test_data["pressure_noise"] = pressure_noise
             
             # Determine pass/fail
             if leak_rate <= self.config.max_leak_rate:
@@ -583,7 +902,8 @@ class TestRunner:
             logger.info(f"Exhausting DUT for {self.config.exhaust_time}s")
             self._log_pressure("before exhaust")
             
-            success = self.solenoid_valves.exhaust(duration=self.config.exhaust_time)
+            success = self._run_while_sampling("exhausting", self.solenoid_valves.exhaust,
+                                               duration=self.config.exhaust_time)
             
             if success:
                 self._log_pressure("after exhaust")
@@ -603,7 +923,8 @@ class TestRunner:
         
         try:
             logger.info(f"Retracting cylinders for {self.config.cylinder_retract_time}s")
-            success = self.cylinders.retract(duration=self.config.cylinder_retract_time)
+            success = self._run_while_sampling("retracting", self.cylinders.retract,
+                                               duration=self.config.cylinder_retract_time)
             
             if success:
                 logger.info("✓ Cylinders retracted successfully")
@@ -621,13 +942,14 @@ class TestRunner:
         logger.warning("EMERGENCY STOP - Turning off all hardware")
         
         try:
-            # Turn off all solenoids
+            # Drop every relay in one batched call first, so the hardware is
+            # safe before any per-controller bookkeeping runs
+            self.relay_controller.turn_off_all()
+            
+            # Bring the valve and cylinder state in line with the relays
             self.solenoid_valves.close_all_valves()
             self.cylinders.stop()
             
-            # Turn off all relays
-            self.relay_controller.turn_off_all()
-            
             logger.info("Emergency stop completed")
             
         except Exception as e:
@@ -653,13 +975,16 @@ class TestRunner:
             logger.warning("Test in progress - performing emergency stop")
             self._emergency_stop()
         
-        # Close data logger
+        # Let any in-flight hardware action finish before closing controllers
+        self._executor.shutdown(wait=True)
+        
+        # Flush and close the data logger (file I/O) while the hardware
+        # controllers close (GPIO); the two share nothing
+        log_closer = None
         if self.enable_logging and self.data_logger:
-            try:
-                self.data_logger.close()
-                logger.info("Data logger closed")
-            except Exception as e:
-                logger.error(f"Error closing data logger: {e}")
+            log_closer = threading.Thread(target=self._close_data_logger,
+                                          name="TestRunnerLogClose")
+            log_closer.start()
         
         # Close hardware controllers
         try:
@@ -668,6 +993,17 @@ class TestRunner:
             # relay_controller is closed by solenoid_valves
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
+        
+        if log_closer is not None:
+            log_closer.join()
+    
+    def _close_data_logger(self):
+        """Close the data logger, logging rather than raising errors."""
+        try:
+            self.data_logger.close()
+            logger.info("Data logger closed")
+        except Exception as e:
+            logger.error(f"Error closing data logger: {e}")
 
 def main():
     """Test the test runner framework."""
@@ -699,7 +1035,7 @@ def main():
         print("\nTest data:")
         test_data = test_runner.get_test_data()
         for key, value in test_data.items():
-            if key != "pressure_readings":  # Skip detailed pressure data
+            if key not in ("pressure_times", "pressure_values", "batch_times", "batch_means"):  # Skip detailed pressure data
                 print(f"  {key}: {value}")
         
         # Show data logging info